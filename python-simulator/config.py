@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulatorConfig:
     """Configuration for the satellite simulator"""
 
@@ -13,5 +14,11 @@ class SimulatorConfig:
     max_connections_per_host: int
     anomaly_rate: float
 
-    # Runtime state
-    running: bool = True
+    # Batching: points are coalesced into POST /telemetry/batch requests.
+    # A batch_size of 1 sends every point on its own to POST /telemetry.
+    batch_size: int = 50          # Max points per request
+    batch_interval: float = 0.1   # Seconds a sender waits for a batch to fill
+    batch_senders: int = 8        # Concurrent batch requests
+
+    # Runtime state: set to stop the simulator; loops wake on it immediately
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
@@ -6,23 +6,52 @@ Provides realistic orbital mechanics for satellite position tracking.
 """
 
 import logging
+import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Union
 
+import numpy as np
+from sgp4.api import SatrecArray
 from skyfield.api import EarthSatellite, load, wgs84
-from skyfield.toposlib import GeographicPosition
+from skyfield.positionlib import ICRF
+from skyfield.sgp4lib import TEME
+from skyfield.timelib import Time, Timescale
+from skyfield.units import Distance, Velocity
 
-from .tle_manager import TLEData, TLEManager
+from .tle_manager import PARTIAL_MATCH_MEMO_SIZE, TLEData, TLEManager
 
 logger = logging.getLogger(__name__)
 
+# Julian date of the Unix epoch (1970-01-01T00:00:00Z)
+JD_UNIX_EPOCH = 2440587.5
+SECONDS_PER_DAY = 86400.0
 
-@dataclass
+# Batch position output. Propagation runs in float64; results are stored as
+# float32 (~1 m horizontal, ~3 cm altitude resolution) to halve memory traffic.
+POSITION_DTYPE = np.float32
+
+# Fields of PositionData, in order; also the keys of batch results
+POSITION_FIELDS = ("latitude", "longitude", "altitude_km", "velocity_kmph")
+
+# Columns of PositionCalculator.elements: SGP4 mean elements (angles in
+# radians, mean motion in radians per minute), TLE epoch as a Julian date,
+# and the catalog number
+ELEMENT_FIELDS = (
+    "bstar", "inclo", "nodeo", "ecco", "argpo", "mo", "no_kozai", "epoch_jd", "satnum",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class PositionData:
     """
     Satellite position data at a specific time.
 
+    Immutable, so callers may cache and share instances (TelemetryGenerator
+    keys its rounded payload fields on the instance). Positions for many
+    satellites or times are returned as arrays by get_positions_batch
+    instead.
+
     Attributes:
         latitude: Latitude in degrees (-90 to 90)
         longitude: Longitude in degrees (-180 to 180)
@@ -52,38 +81,171 @@ class PositionCalculator:
     # Earth's mean radius in kilometers (for reference)
     EARTH_RADIUS_KM = 6371.0
 
-    def __init__(self, tle_data: Dict[str, TLEData]):
+    def __init__(self, tle_data: Dict[str, TLEData], ts: Optional[Timescale] = None):
         """
         Initialize position calculator with TLE data.
 
         Args:
             tle_data: Dictionary mapping satellite names to TLEData objects
+            ts: Skyfield timescale to share; a builtin one is loaded if omitted
         """
         self.tle_data = tle_data
         self.satellites: Dict[str, EarthSatellite] = {}
-        self.ts = load.timescale()
+        self.ts = ts if ts is not None else load.timescale(builtin=True)
+
+        # Uppercase name indexes for O(1) case-insensitive lookups.
+        # The first entry wins when names differ only by case.
+        self._satellites_by_upper: Dict[str, EarthSatellite] = {}
+        self._tle_by_upper: Dict[str, TLEData] = {}
+        for name, tle in tle_data.items():
+            self._tle_by_upper.setdefault(name.upper(), tle)
+
+        # Orbital elements of every loaded satellite, one row each with
+        # columns ELEMENT_FIELDS, plus the uppercase name -> row index
+        self.elements = np.empty((0, len(ELEMENT_FIELDS)))
+        self._element_rows: Dict[str, int] = {}
+
+        # sgp4 Satrec of each element row, the input to SatrecArray
+        self._models: list = []
+
+        # Results of _lookup's partial-match scan, by (id(index), uppercase name)
+        self._partial_matches: Dict[tuple, object] = {}
+
+        # Orbital periods in minutes, derived once from the mean motion
+        self._periods: Dict[str, float] = {}
+
+        # SatrecArray for the last satellite set seen by get_positions_batch,
+        # reused while callers keep asking for the same satellites each tick
+        self._satrec_array_key: Optional[tuple] = None
+        self._satrec_array_value: Optional[SatrecArray] = None
+
+        # TT - UTC in days for the UTC day it was looked up for. It only
+        # changes at leap seconds, which fall at the end of a UTC day.
+        self._tt_offset_day: Optional[int] = None
+        self._tt_offset = 0.0
 
         # Load satellites from TLE data
         self._load_satellites()
 
     def _load_satellites(self) -> None:
-        """Load TLE data into Skyfield EarthSatellite objects"""
+        """Load TLE data into Skyfield EarthSatellite objects and an element array"""
+        rows = []
         for name, tle in self.tle_data.items():
             try:
                 satellite = EarthSatellite(tle.line1, tle.line2, name, self.ts)
-                self.satellites[name] = satellite
             except Exception as e:
-                logger.warning(f"Failed to load satellite {name}: {e}")
+                logger.warning("Failed to load satellite %s: %s", name, e)
+                continue
+
+            self.satellites[name] = satellite
+            self._satellites_by_upper.setdefault(name.upper(), satellite)
+            self._element_rows.setdefault(name.upper(), len(rows))
+
+            # Elements as already decoded by sgp4 while parsing the TLE
+            model = satellite.model
+            self._models.append(model)
+            rows.append((
+                model.bstar, model.inclo, model.nodeo, model.ecco, model.argpo,
+                model.mo, model.no_kozai, model.jdsatepoch + model.jdsatepochF,
+                model.satnum,
+            ))
+
+        if rows:
+            self.elements = np.array(rows, dtype=np.float64)
+
+        # Mean motion is in radians per minute; skip unusable (zero) values
+        mean_motion = self.elements[:, ELEMENT_FIELDS.index("no_kozai")].tolist()
+        self._periods = {
+            name: 2 * math.pi / mean_motion[row]
+            for name, row in self._element_rows.items()
+            if mean_motion[row] > 0
+        }
+
+        logger.info("Loaded %d satellites for position calculation", len(self.satellites))
+
+    def time_at(self, timestamp: Union[datetime, float]) -> Time:
+        """
+        Convert a datetime or Unix timestamp to a Skyfield Time.
+
+        Build it once per tick and pass it to get_position_at() or
+        get_positions_at() to share it across satellites.
 
-        logger.info(f"Loaded {len(self.satellites)} satellites for position calculation")
+        Args:
+            timestamp: datetime (naive datetimes are treated as UTC) or
+                seconds since the Unix epoch, e.g. time.time()
 
-    def get_position(self, satellite_name: str, timestamp: datetime) -> Optional[PositionData]:
+        Returns:
+            Skyfield Time object
+        """
+        if isinstance(timestamp, datetime):
+            return self.ts.from_datetime(self._to_utc(timestamp))
+
+        # Fast path: Julian date arithmetic instead of calendar decomposition
+        jd_utc = JD_UNIX_EPOCH + timestamp / SECONDS_PER_DAY
+        day = int(timestamp // SECONDS_PER_DAY)
+        if day != self._tt_offset_day:
+            t = self.ts.from_datetime(datetime.fromtimestamp(timestamp, timezone.utc))
+            self._tt_offset = t.tt - jd_utc
+            self._tt_offset_day = day
+        return self.ts.tt_jd(jd_utc, self._tt_offset)
+
+    def get_position(
+        self,
+        satellite_name: str,
+        timestamp: Union[datetime, float]
+    ) -> Optional[PositionData]:
         """
         Calculate satellite position at a given time.
 
         Args:
             satellite_name: Name of the satellite (case-insensitive)
-            timestamp: Time at which to calculate position
+            timestamp: Time at which to calculate position, as a datetime or
+                Unix timestamp (see time_at())
+
+        Returns:
+            PositionData object with position and velocity, or None if satellite not found
+        """
+        try:
+            t = self.time_at(timestamp)
+        except Exception as e:
+            logger.error("Error calculating position for %s: %s", satellite_name, e)
+            return None
+
+        return self.get_position_at(satellite_name, t)
+
+    def get_positions_at(
+        self,
+        satellite_names: Sequence[str],
+        t: Time
+    ) -> list[Optional[PositionData]]:
+        """
+        Calculate positions for several satellites at one pre-built time.
+
+        All satellites are propagated together by get_positions_batch(), so
+        values carry its POSITION_DTYPE resolution.
+
+        Args:
+            satellite_names: Names of the satellites (case-insensitive)
+            t: Skyfield Time shared by all satellites, see time_at()
+
+        Returns:
+            PositionData for each name, in order; None if the satellite was
+            not found or could not be propagated
+        """
+        positions = self.get_positions_batch(satellite_names, t)
+        columns = zip(*(positions[field][:, 0].tolist() for field in POSITION_FIELDS))
+        return [
+            None if math.isnan(values[0]) else PositionData(*values)
+            for values in columns
+        ]
+
+    def get_position_at(self, satellite_name: str, t: Time) -> Optional[PositionData]:
+        """
+        Calculate satellite position at a pre-built Skyfield time.
+
+        Args:
+            satellite_name: Name of the satellite (case-insensitive)
+            t: Skyfield Time, see time_at()
 
         Returns:
             PositionData object with position and velocity, or None if satellite not found
@@ -91,29 +253,10 @@ class PositionCalculator:
         # Find satellite (case-insensitive)
         satellite = self._find_satellite(satellite_name)
         if satellite is None:
-            logger.warning(f"Satellite {satellite_name} not found")
+            logger.warning("Satellite %s not found", satellite_name)
             return None
 
         try:
-            # Convert timestamp to Skyfield time
-            # Skyfield uses UTC internally, so we convert to UTC
-            if timestamp.tzinfo is None:
-                # Assume UTC if no timezone info
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            else:
-                # Convert to UTC
-                timestamp = timestamp.astimezone(timezone.utc)
-
-            # Create Skyfield time object
-            t = self.ts.utc(
-                timestamp.year,
-                timestamp.month,
-                timestamp.day,
-                timestamp.hour,
-                timestamp.minute,
-                timestamp.second + timestamp.microsecond / 1_000_000
-            )
-
             # Calculate position
             geocentric = satellite.at(t)
 
@@ -127,9 +270,8 @@ class PositionCalculator:
             # Calculate velocity
             # Skyfield gives velocity as a 3D vector in km/s
             # We need to compute the magnitude (scalar speed)
-            import numpy as np
-            velocity_kms = geocentric.velocity.km_per_s
-            velocity_kmph = float(np.linalg.norm(velocity_kms)) * 3600.0
+            vx, vy, vz = geocentric.velocity.km_per_s
+            velocity_kmph = math.sqrt(vx * vx + vy * vy + vz * vz) * 3600.0
 
             # Normalize longitude to -180 to 180 range
             if longitude > 180:
@@ -145,9 +287,150 @@ class PositionCalculator:
             )
 
         except Exception as e:
-            logger.error(f"Error calculating position for {satellite_name}: {e}")
+            logger.error("Error calculating position for %s: %s", satellite_name, e)
             return None
 
+    def get_positions_batch(
+        self,
+        satellite_names: Sequence[str],
+        timestamps: Union[Sequence[datetime], Time]
+    ) -> dict[str, np.ndarray]:
+        """
+        Calculate positions for many satellites over many times at once.
+
+        Propagates every requested satellite over every timestamp in a single
+        call to sgp4's compiled SatrecArray propagator, then converts the TEME
+        states to geodetic coordinates in one vectorized Skyfield pass.
+
+        Args:
+            satellite_names: Names of the satellites (case-insensitive)
+            timestamps: Times at which to calculate positions, or a Skyfield
+                Time (a single time gives one column)
+
+        Returns:
+            Dictionary with latitude, longitude, altitude_km and velocity_kmph
+            POSITION_DTYPE arrays of shape (len(satellite_names), len(timestamps)).
+            Rows for unknown satellites, and entries SGP4 fails to propagate, are NaN.
+        """
+        rows = self.satellite_indices(satellite_names)
+
+        if isinstance(timestamps, Time):
+            t = timestamps
+        else:
+            t = self.ts.from_datetimes([self._to_utc(ts) for ts in timestamps])
+        jd, fr = self._utc_jd(t)
+        positions = self._propagate(rows, t, np.atleast_1d(jd), np.atleast_1d(fr))
+        return {field: values.astype(POSITION_DTYPE) for field, values in positions.items()}
+
+    def satellite_indices(self, satellite_names: Sequence[str]) -> np.ndarray:
+        """
+        Look up the row of self.elements for each satellite name.
+
+        Args:
+            satellite_names: Names of the satellites (case-insensitive)
+
+        Returns:
+            Integer array of element rows, -1 where the satellite is unknown
+        """
+        rows = np.full(len(satellite_names), -1, dtype=np.intp)
+        for i, satellite_name in enumerate(satellite_names):
+            row = self._lookup(self._element_rows, satellite_name)
+            if row is None:
+                logger.warning("Satellite %s not found", satellite_name)
+            else:
+                rows[i] = row
+        return rows
+
+    def _propagate(
+        self,
+        rows: np.ndarray,
+        t: Time,
+        jd: np.ndarray,
+        fr: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        Propagate element rows over UTC Julian dates jd + fr in one pass.
+
+        Returns float64 arrays of shape (len(rows), len(jd)) keyed by
+        POSITION_FIELDS; entries are NaN for rows of -1 and wherever
+        propagation fails.
+        """
+        shape = (len(rows), len(jd))
+        result = {field: np.full(shape, np.nan) for field in POSITION_FIELDS}
+
+        # Satellites may repeat (e.g. cycled names), so propagate each once
+        found = rows >= 0
+        unique_rows, columns = np.unique(rows[found], return_inverse=True)
+        if not len(unique_rows) or not len(jd):
+            return result
+
+        try:
+            # Not fanned out over a thread pool: sgp4's C loop holds the GIL,
+            # so threads serialize, and at per-tick sizes it is only about a
+            # third of this method; the Skyfield conversion below is the rest.
+            models = [self._models[row] for row in unique_rows.tolist()]
+            errors, position_km, velocity_kms = self._satrec_array(models).sgp4(jd, fr)
+
+            # SatrecArray returns (satellite, time, xyz); Skyfield wants xyz first
+            geocentric = ICRF.from_time_and_frame_vectors(
+                t, TEME,
+                Distance(km=np.moveaxis(position_km, -1, 0)),
+                Velocity(km_per_s=np.moveaxis(velocity_kms, -1, 0)),
+            )
+            geocentric.center = 399
+            subpoint = wgs84.subpoint(geocentric)
+        except Exception as e:
+            logger.error("Error calculating batch positions: %s", e)
+            return result
+
+        # TEME -> ITRS is a rotation, so the speed is frame independent
+        computed = {
+            "latitude": subpoint.latitude.degrees,
+            "longitude": subpoint.longitude.degrees,
+            "altitude_km": subpoint.elevation.km,
+            "velocity_kmph": np.sqrt(
+                np.sum(velocity_kms * velocity_kms, axis=-1)
+            ) * 3600.0,
+        }
+        failed = errors != 0
+        for field, values in computed.items():
+            values = np.where(failed, np.nan, np.reshape(values, failed.shape))
+            result[field][found] = values[columns]
+
+        # Normalize longitude to -180 to 180 range
+        longitude = result["longitude"]
+        longitude[longitude > 180] -= 360
+        longitude[longitude < -180] += 360
+
+        return result
+
+    @staticmethod
+    def _utc_jd(t: Time) -> tuple:
+        """
+        Split t into the UTC Julian dates (jd, fr) that sgp4 propagates to.
+
+        This is the same split EarthSatellite.at() hands to sgp4, taken from
+        the Time's own arrays so a whole batch of times converts in one
+        vectorized step; sgp4 then derives each satellite's minutes since
+        epoch from it in C.
+        """
+        return t.whole, t.tai_fraction - t._leap_seconds() / SECONDS_PER_DAY
+
+    def _satrec_array(self, models: list) -> SatrecArray:
+        """Return a SatrecArray for models, reusing the previous one if unchanged"""
+        key = tuple(id(model) for model in models)
+        if key != self._satrec_array_key:
+            self._satrec_array_value = SatrecArray(models)
+            self._satrec_array_key = key
+        return self._satrec_array_value
+
+    @staticmethod
+    def _to_utc(timestamp: datetime) -> datetime:
+        """Return timestamp in UTC, treating naive datetimes as UTC"""
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.astimezone(timezone.utc)
+
     def get_velocity(self, satellite_name: str, timestamp: datetime) -> Optional[float]:
         """
         Calculate satellite velocity at a given time.
@@ -194,19 +477,7 @@ class PositionCalculator:
             observer = wgs84.latlon(observer_lat, observer_lon, observer_alt_km)
 
             # Convert timestamp to Skyfield time
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            else:
-                timestamp = timestamp.astimezone(timezone.utc)
-
-            t = self.ts.utc(
-                timestamp.year,
-                timestamp.month,
-                timestamp.day,
-                timestamp.hour,
-                timestamp.minute,
-                timestamp.second + timestamp.microsecond / 1_000_000
-            )
+            t = self.time_at(timestamp)
 
             # Calculate satellite position relative to observer
             difference = satellite - observer
@@ -220,22 +491,12 @@ class PositionCalculator:
             return bool(alt.degrees >= min_elevation_deg)
 
         except Exception as e:
-            logger.error(f"Error checking visibility for {satellite_name}: {e}")
+            logger.error("Error checking visibility for %s: %s", satellite_name, e)
             return None
 
     def _find_satellite(self, satellite_name: str) -> Optional[EarthSatellite]:
         """Find satellite by name (case-insensitive)"""
-        # Try exact match (case-insensitive)
-        for name, satellite in self.satellites.items():
-            if name.upper() == satellite_name.upper():
-                return satellite
-
-        # Try partial match
-        for name, satellite in self.satellites.items():
-            if satellite_name.upper() in name.upper():
-                return satellite
-
-        return None
+        return self._lookup(self._satellites_by_upper, satellite_name)
 
     def get_available_satellites(self) -> list[str]:
         """Get list of available satellite names"""
@@ -251,38 +512,32 @@ class PositionCalculator:
         Returns:
             Orbital period in minutes, or None if not found
         """
-        satellite = self._find_satellite(satellite_name)
-        if satellite is None:
-            return None
-
-        try:
-            # Extract mean motion from TLE line 2 (columns 53-63, 0-indexed: 52:63)
-            # Mean motion is in revolutions per day
-            tle = self._find_tle(satellite_name)
-            if tle is None:
-                return None
-
-            # Extract mean motion from TLE line 2 (columns 53-63)
-            mean_motion_rev_day = float(tle.line2[52:63])
-
-            # Convert to period in minutes
-            # Period = 1440 minutes / mean motion (revolutions per day)
-            period_minutes = 1440.0 / mean_motion_rev_day
-
-            return period_minutes
-
-        except Exception as e:
-            logger.error(f"Error calculating orbital period for {satellite_name}: {e}")
-            return None
+        return self._lookup(self._periods, satellite_name)
 
     def _find_tle(self, satellite_name: str) -> Optional[TLEData]:
-        """Find TLE data for a satellite"""
-        for name, tle in self.tle_data.items():
-            if name.upper() == satellite_name.upper():
-                return tle
-            if satellite_name.upper() in name.upper():
-                return tle
-        return None
+        """Find TLE data for a satellite (case-insensitive)"""
+        return self._lookup(self._tle_by_upper, satellite_name)
+
+    def _lookup(self, index: dict, satellite_name: str):
+        """Exact match on an uppercase-keyed index, then first partial match"""
+        key = satellite_name.upper()
+        value = index.get(key)
+        if value is not None:
+            return value
+
+        # The indexes never change after loading, so remember partial
+        # matches (and misses) instead of rescanning on every call
+        memo_key = (id(index), key)
+        try:
+            return self._partial_matches[memo_key]
+        except KeyError:
+            pass
+
+        value = next((value for name, value in index.items() if key in name), None)
+        if len(self._partial_matches) >= PARTIAL_MATCH_MEMO_SIZE:
+            self._partial_matches.clear()
+        self._partial_matches[memo_key] = value
+        return value
 
 
 def create_position_manager() -> PositionCalculator:
@@ -1,12 +1,61 @@
-import random
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
+from skyfield.timelib import Time
 
 from .position_calc import PositionCalculator, PositionData
 
+# Number of readings worth of random draws generated per refill.
+# Kept small since every satellite in a swarm owns its own buffers.
+RANDOM_BUFFER_SIZE = 256
+
+ANOMALY_TYPES = (
+    "battery_critical",
+    "storage_full",
+    "signal_loss",
+    "sudden_discharge",
+)
+
+# Anomaly readings indexed by [type][battery, storage, signal] as
+# (weight, low, high): value = weight * current + uniform(low, high).
+# A weight of 0 replaces the reading outright, 1 perturbs it.
+_ANOMALY_TABLE = np.array([
+    [[0, 0, 10], [1, 0, 100], [1, -5, 5]],        # battery_critical
+    [[1, -2, 2], [0, 95000, 100000], [1, -5, 5]],  # storage_full
+    [[1, -2, 2], [1, 0, 100], [0, -120, -110]],    # signal_loss
+    [[1, -40, -20], [1, 0, 100], [1, -5, 5]],     # sudden_discharge
+], dtype=float)
+# Same table as nested lists for the scalar path (cheap Python floats)
+_ANOMALY_ROWS = _ANOMALY_TABLE.tolist()
+
+
+def _round2(x: float) -> float:
+    """
+    Round to 2 decimals, like round(x, 2) but several times faster.
+
+    round() with ndigits goes through a decimal string conversion, which
+    dominated the cost of a reading. Scaling, rounding to an integer and
+    dividing gives the same float (and the same short repr) except in rare
+    cases where x * 100 falls within float error of a half.
+    """
+    return round(x * 100) / 100
+
+
+def _round6(x: float) -> float:
+    """Round to 6 decimals, like round(x, 6); see _round2"""
+    return round(x * 1_000_000) / 1_000_000
+
+
+# One fleet reading per satellite. float64 keeps storage (up to 100000 MB)
+# exact to the two decimals we emit.
+TELEMETRY_DTYPE = np.dtype([
+    ("battery", np.float64),
+    ("storage", np.float64),
+    ("signal", np.float64),
+])
+
 
 @dataclass
 class TelemetryGenerator:
@@ -25,127 +74,192 @@ class TelemetryGenerator:
     anomaly_rate: float = 0.01   # 1% chance of anomaly
     satellite_name: Optional[str] = None  # Real satellite name for position calculation
     position_calculator: Optional[PositionCalculator] = None  # For orbital position calculation
+    seed: Optional[int] = None  # Seed for this generator's random stream
 
     def __post_init__(self):
+        # Per-generator SFC64 stream: faster than the legacy global RandomState
+        # (and than numpy's default PCG64), and reproducible per satellite
+        # when seeded
+        self.rng = np.random.Generator(np.random.SFC64(self.seed))
+
         # Initialize random walk parameters
         self.battery = self.base_battery
         self.storage = self.base_storage
         self.signal = self.base_signal
 
         # Random walk parameters
-        self.battery_drain_rate = np.random.normal(0.05, 0.01)  # ~0.05% per reading
-        self.storage_growth_rate = np.random.normal(10.0, 2.0)   # ~10 MB per reading
-        self.signal_volatility = np.random.normal(0.5, 0.1)      # Signal fluctuation
+        self.battery_drain_rate = self.rng.normal(0.05, 0.01)  # ~0.05% per reading
+        self.storage_growth_rate = self.rng.normal(10.0, 2.0)   # ~10 MB per reading
+        self.signal_volatility = self.rng.normal(0.5, 0.1)      # Signal fluctuation
 
         # Track last position for smooth interpolation
         self.last_position: Optional[PositionData] = None
 
+        # Whether readings carry a position, decided once instead of per reading
+        self._tracks_position = bool(self.position_calculator and self.satellite_name)
+
+        # Skyfield time of the current tick, set by a caller driving several
+        # generators from one clock so they share one Time object instead of
+        # building their own (see PositionCalculator.time_at)
+        self.current_t: Optional[Time] = None
+
+        # Last computed position and the wall-clock second it belongs to.
+        # Positions barely move within a second, so faster send rates reuse it.
+        self._pos_cache_key: Optional[int] = None
+        self._pos_cache_val: Optional[PositionData] = None
+
+        # Rounded payload fields of the last position emitted. The cached and
+        # fallback paths hand back the same PositionData, so it is rounded once.
+        self._rounded_pos_src: Optional[PositionData] = None
+        self._rounded_pos: dict[str, float] = {}
+
+        # Pre-drawn random numbers, filled in bulk on first use and when exhausted.
+        # Kept as Python lists so each pop is a cheap float, not a numpy scalar.
+        self._noise_buf: list[list[float]] = []
+        self._noise_idx = RANDOM_BUFFER_SIZE
+        self._uniform_buf: list[float] = []
+        self._uniform_idx = RANDOM_BUFFER_SIZE
+
+    def _next_noise(self) -> list[float]:
+        """Return the next row of three standard normal samples"""
+        if self._noise_idx == RANDOM_BUFFER_SIZE:
+            self._noise_buf = self.rng.standard_normal((RANDOM_BUFFER_SIZE, 3)).tolist()
+            self._noise_idx = 0
+        row = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        return row
+
+    def _next_uniform(self, low: float = 0.0, high: float = 1.0) -> float:
+        """Return the next uniform sample scaled to [low, high)"""
+        if self._uniform_idx == RANDOM_BUFFER_SIZE:
+            self._uniform_buf = self.rng.random(RANDOM_BUFFER_SIZE).tolist()
+            self._uniform_idx = 0
+        u = self._uniform_buf[self._uniform_idx]
+        self._uniform_idx += 1
+        return low + (high - low) * u
+
     def generate_telemetry(self) -> dict[str, float]:
         """Generate a single telemetry point with position data"""
 
-        # Decide if this should be an anomaly
-        is_anomaly = random.random() < self.anomaly_rate
-
         # Get base telemetry data
-        if is_anomaly:
-            telemetry = self._generate_anomaly()
-        else:
-            telemetry = self._generate_normal()
+        telemetry = self._generate_reading()
 
         # Add position data if calculator is available
-        if self.position_calculator and self.satellite_name:
+        if self._tracks_position:
             position = self._get_current_position()
             if position:
-                telemetry["latitude"] = round(position.latitude, 6)
-                telemetry["longitude"] = round(position.longitude, 6)
-                telemetry["altitude_km"] = round(position.altitude_km, 2)
-                telemetry["velocity_kmph"] = round(position.velocity_kmph, 2)
+                if position is not self._rounded_pos_src:
+                    self._rounded_pos_src = position
+                    self._rounded_pos = {
+                        "latitude": _round6(position.latitude),
+                        "longitude": _round6(position.longitude),
+                        "altitude_km": _round2(position.altitude_km),
+                        "velocity_kmph": _round2(position.velocity_kmph),
+                    }
+                telemetry.update(self._rounded_pos)
 
         return telemetry
 
-    def _get_current_position(self) -> Optional[PositionData]:
-        """Get current satellite position based on orbital mechanics"""
-        if not self.position_calculator or not self.satellite_name:
-            return None
+    def generate_batch(self, n: int) -> dict[str, np.ndarray]:
+        """
+        Generate n consecutive telemetry readings as arrays.
 
-        try:
-            timestamp = datetime.now(timezone.utc)
-            position = self.position_calculator.get_position(self.satellite_name, timestamp)
+        Readings follow the same random walk and anomaly model as
+        generate_telemetry() and advance this generator's state; position
+        data is not included.
 
-            if position:
-                self.last_position = position
-                return position
+        Args:
+            n: Number of readings
 
-            # Fallback to last known position if calculation fails
-            return self.last_position
+        Returns:
+            Dictionary mapping battery, storage and signal to float64 arrays
+        """
+        readings = [self._generate_reading() for _ in range(n)]
+        return {
+            name: np.fromiter((r[name] for r in readings), dtype=np.float64, count=n)
+            for name in TELEMETRY_DTYPE.names
+        }
+
+    def _generate_reading(self) -> dict[str, float]:
+        """Generate the next battery/storage/signal reading, normal or anomalous"""
+        # Rates of 0 and 1 decide without spending a random draw
+        rate = self.anomaly_rate
+        if rate > 0.0 and (rate >= 1.0 or self._next_uniform() < rate):
+            return self._generate_anomaly()
+        return self._generate_normal()
 
-        except Exception:
-            # Return last known position on error
+    def _get_current_position(self) -> Optional[PositionData]:
+        """Get current satellite position based on orbital mechanics"""
+        now = time.time()
+        key = int(now)
+        if key == self._pos_cache_key:
+            return self._pos_cache_val
+
+        self._pos_cache_key = key
+        self._pos_cache_val = self._calculate_position(now)
+        return self._pos_cache_val
+
+    def _calculate_position(self, now: float) -> Optional[PositionData]:
+        """Propagate the satellite to now (Unix time) or the pushed tick time"""
+        # The calculator logs and returns None on failure instead of raising,
+        # so fall back to the last known position
+        if self.current_t is not None:
+            position = self.position_calculator.get_position_at(
+                self.satellite_name, self.current_t
+            )
+        else:
+            position = self.position_calculator.get_position(self.satellite_name, now)
+
+        if position is None:
             return self.last_position
 
+        self.last_position = position
+        return position
+
     def _generate_normal(self) -> dict[str, float]:
         """Generate normal telemetry with realistic trends"""
 
-        # Battery: Gradual drain with small fluctuations
-        self.battery -= self.battery_drain_rate
-        self.battery += np.random.normal(0, 0.5)  # Small fluctuation
-        self.battery = max(0, min(100, self.battery))  # Clamp to [0, 100]
+        battery_noise, storage_noise, signal_noise = self._next_noise()
 
-        # Storage: Gradual accumulation
-        self.storage += self.storage_growth_rate
-        self.storage += np.random.normal(0, 5)  # Small fluctuation
-        self.storage = max(0, self.storage)  # No negative storage
+        # Battery: Gradual drain with small fluctuations, never below empty
+        battery = max(0.0, self.battery - self.battery_drain_rate + battery_noise * 0.5)
 
-        # Signal: Fluctuate around base
-        signal_change = np.random.normal(0, self.signal_volatility)
-        self.signal += signal_change
-        self.signal = max(-120, min(-30, self.signal))  # Typical range for dBm
+        # Storage: Gradual accumulation, no negative storage
+        self.storage = max(0.0, self.storage + self.storage_growth_rate + storage_noise * 5)
+
+        # Signal: Fluctuate around base, typical range for dBm
+        self.signal = max(-120.0, min(-30.0, self.signal + signal_noise * self.signal_volatility))
 
         # Simulate occasional data transmission (storage cleanup)
-        if self.storage > 90000 and random.random() < 0.1:  # 10% chance when > 90GB
-            self.storage -= np.random.uniform(5000, 20000)  # Transmit 5-20 GB
+        if self.storage > 90000 and self._next_uniform() < 0.1:  # 10% chance when > 90GB
+            self.storage -= self._next_uniform(5000, 20000)  # Transmit 5-20 GB
 
         # Simulate occasional battery charging (when in sunlight)
-        if self.battery < 30 and random.random() < 0.05:  # 5% chance when < 30%
-            self.battery += np.random.uniform(5, 15)  # Charge 5-15%
+        if battery < 30 and self._next_uniform() < 0.05:  # 5% chance when < 30%
+            battery += self._next_uniform(5, 15)  # Charge 5-15%
 
-        # Re-clamp battery after charging to ensure it stays within bounds
-        self.battery = max(0, min(100, self.battery))
+        # Charging can overshoot a full battery
+        self.battery = min(100.0, battery)
 
         return {
-            "battery": round(self.battery, 2),
-            "storage": round(self.storage, 2),
-            "signal": round(self.signal, 2)
+            "battery": _round2(self.battery),
+            "storage": _round2(self.storage),
+            "signal": _round2(self.signal)
         }
 
     def _generate_anomaly(self) -> dict[str, float]:
         """Generate anomalous telemetry"""
 
-        anomaly_type = random.choice([
-            "battery_critical",
-            "storage_full",
-            "signal_loss",
-            "sudden_discharge"
-        ])
-
-        battery, storage, signal = 0, 0, 0
-
-        if anomaly_type == "battery_critical":
-            battery = random.uniform(0, 10)  # Critically low
-            storage = self.storage + random.uniform(0, 100)
-            signal = self.signal + random.uniform(-5, 5)
-        elif anomaly_type == "storage_full":
-            battery = self.battery + random.uniform(-2, 2)
-            storage = random.uniform(95000, 100000)  # Near capacity
-            signal = self.signal + random.uniform(-5, 5)
-        elif anomaly_type == "signal_loss":
-            battery = self.battery + random.uniform(-2, 2)
-            storage = self.storage + random.uniform(0, 100)
-            signal = random.uniform(-120, -110)  # Very weak signal
-        else:  # sudden_discharge
-            battery = self.battery - random.uniform(20, 40)  # Sudden drop
-            storage = self.storage + random.uniform(0, 100)
-            signal = self.signal + random.uniform(-5, 5)
+        battery_row, storage_row, signal_row = _ANOMALY_ROWS[
+            int(self._next_uniform(0, len(ANOMALY_TYPES)))
+        ]
+
+        weight, low, high = battery_row
+        battery = weight * self.battery + self._next_uniform(low, high)
+        weight, low, high = storage_row
+        storage = weight * self.storage + self._next_uniform(low, high)
+        weight, low, high = signal_row
+        signal = weight * self.signal + self._next_uniform(low, high)
 
         # Clamp all values to valid ranges
         battery = max(0, min(100, battery))
@@ -153,7 +267,134 @@ class TelemetryGenerator:
         signal = max(-120, min(-30, signal))
 
         return {
-            "battery": round(battery, 2),
-            "storage": round(storage, 2),
-            "signal": round(signal, 2)
+            "battery": _round2(battery),
+            "storage": _round2(storage),
+            "signal": _round2(signal)
         }
+
+
+class TelemetryFleet:
+    """
+    Generates telemetry for a whole fleet of satellites at once.
+
+    State is held as parallel NumPy arrays (one element per satellite) so a
+    tick advances every satellite with a handful of vectorized operations
+    instead of one generate_telemetry() call per satellite. Follows the same
+    random walk and anomaly model as TelemetryGenerator, though not the same
+    sequence of random draws.
+    """
+
+    def __init__(
+        self,
+        num_satellites: int,
+        base_battery: float = 100.0,
+        base_storage: float = 0.0,
+        base_signal: float = -50.0,
+        anomaly_rate: float = 0.01,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize fleet state.
+
+        Args:
+            num_satellites: Number of satellites in the fleet
+            base_battery: Starting battery percentage for every satellite
+            base_storage: Starting storage in MB for every satellite
+            base_signal: Base signal in dBm for every satellite
+            anomaly_rate: Per-reading probability of an anomaly
+            seed: Seed for the fleet's random stream
+        """
+        self.num_satellites = num_satellites
+        self.anomaly_rate = anomaly_rate
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+
+        self.battery = np.full(num_satellites, base_battery, dtype=np.float64)
+        self.storage = np.full(num_satellites, base_storage, dtype=np.float64)
+        self.signal = np.full(num_satellites, base_signal, dtype=np.float64)
+
+        # Per-satellite random walk parameters
+        self.drain_rates = self.rng.normal(0.05, 0.01, num_satellites)
+        self.growth_rates = self.rng.normal(10.0, 2.0, num_satellites)
+        self.volatilities = self.rng.normal(0.5, 0.1, num_satellites)
+
+        # Emitted readings, reused every tick to avoid per-tick allocations
+        self.records = np.empty(num_satellites, dtype=TELEMETRY_DTYPE)
+
+    def tick(self) -> np.ndarray:
+        """
+        Advance every satellite by one reading.
+
+        Returns:
+            The fleet's TELEMETRY_DTYPE record array, rounded to 2 decimals.
+            It is overwritten in place by the next tick, so copy it to keep it.
+        """
+        n = self.num_satellites
+        rng = self.rng
+        noise = rng.standard_normal((3, n))
+        chance = rng.random((4, n))
+
+        # As in TelemetryGenerator, an anomalous reading is derived from the
+        # state before the step and does not advance the walk
+        anomalous = np.flatnonzero(rng.random(n) < self.anomaly_rate)
+        if anomalous.size:
+            state = (self.battery, self.storage, self.signal)
+            held = [array[anomalous] for array in state]
+
+        # Battery: Gradual drain with small fluctuations
+        self.battery -= self.drain_rates
+        self.battery += noise[0] * 0.5
+        np.clip(self.battery, 0, 100, out=self.battery)
+
+        # Storage: Gradual accumulation
+        self.storage += self.growth_rates
+        self.storage += noise[1] * 5
+        np.maximum(self.storage, 0, out=self.storage)
+
+        # Signal: Fluctuate around base
+        self.signal += noise[2] * self.volatilities
+        np.clip(self.signal, -120, -30, out=self.signal)
+
+        # Per-satellite branches become masked in-place ufuncs, no fancy indexing
+        # Occasional data transmission (10% chance when > 90GB)
+        transmit = (self.storage > 90000) & (chance[0] < 0.1)
+        np.subtract(self.storage, 5000 + 15000 * chance[1], out=self.storage, where=transmit)
+
+        # Occasional battery charging (5% chance when < 30%)
+        charge = (self.battery < 30) & (chance[2] < 0.05)
+        np.add(self.battery, 5 + 10 * chance[3], out=self.battery, where=charge)
+        np.clip(self.battery, 0, 100, out=self.battery)
+
+        if anomalous.size:
+            for array, values in zip(state, held):
+                array[anomalous] = values
+
+        records = self.records
+        records["battery"] = self.battery
+        records["storage"] = self.storage
+        records["signal"] = self.signal
+
+        # Anomalies overwrite the emitted reading only, not the walk state
+        if anomalous.size:
+            self._apply_anomalies(anomalous)
+
+        for name in TELEMETRY_DTYPE.names:
+            np.round(records[name], 2, out=records[name])
+
+        return records
+
+    def _apply_anomalies(self, idx: np.ndarray) -> None:
+        """Overwrite readings at idx with anomalous values"""
+        rng = self.rng
+        rows = _ANOMALY_TABLE[rng.integers(0, len(ANOMALY_TYPES), idx.size)]
+        weight, low, high = rows[..., 0], rows[..., 1], rows[..., 2]
+        current = np.stack([self.battery[idx], self.storage[idx], self.signal[idx]], axis=1)
+        b, s, g = (weight * current + low + (high - low) * rng.random(current.shape)).T
+
+        self.records["battery"][idx] = np.clip(b, 0, 100)
+        self.records["storage"][idx] = np.maximum(s, 0)
+        self.records["signal"][idx] = np.clip(g, -120, -30)
+
+    def generate_telemetry(self) -> list[dict[str, float]]:
+        """Generate one telemetry point per satellite as plain dictionaries"""
+        names = TELEMETRY_DTYPE.names
+        return [dict(zip(names, record)) for record in self.tick().tolist()]
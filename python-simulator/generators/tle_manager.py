@@ -5,16 +5,28 @@ Downloads and caches Two-Line Element (TLE) orbital data from Celestrak.
 Provides real satellite orbital data for position calculations.
 """
 
-import hashlib
-import json
 import logging
 import os
+import re
+import struct
+import time
+import zlib
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import cache
+from itertools import cycle, islice
 from pathlib import Path
 from typing import Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import zstandard
+    _ZSTD_ERRORS = (zstandard.ZstdError,)
+except ImportError:
+    zstandard = None
+    _ZSTD_ERRORS = ()
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +34,62 @@ logger = logging.getLogger(__name__)
 CELESTRAK_BASE_URL = "https://celestrak.org/NORAD/elements/gp.php"
 CELESTRAK_ACTIVE_URL = f"{CELESTRAK_BASE_URL}?GROUP=active&FORMAT=tle"
 
+# Retry transient download failures (connection errors, timeouts, 429 and
+# 5xx answers) with exponential backoff before falling back to static TLEs.
+# Retry-After is ignored so a refresh never stalls for longer than the backoff.
+# A hung server is retried once only, so with DOWNLOAD_TIMEOUT a stalled
+# download still gives up after about 30 s of reading.
+DOWNLOAD_RETRY = Retry(
+    total=3,
+    read=1,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+# (connect, read) timeout in seconds for each download attempt
+DOWNLOAD_TIMEOUT = (5, 15)
+
+# Fixed-size header at the start of the cache file, so a validity check reads
+# one small block instead of a separate metadata file: magic, format version,
+# body codec, cached_at (Unix seconds), satellite count, CRC32 of the stored
+# body after it, and Celestrak's ETag and Last-Modified (NUL-padded, empty if
+# unknown)
+CACHE_MAGIC = b"TLE1"
+CACHE_VERSION = 3
+CACHE_HEADER = struct.Struct("<4sHHQII64s64s")
+
+# Body codecs. The TLE text is zstd-compressed at level 1 (fast, and TLE text
+# is highly repetitive) when zstandard is installed; without it the text is
+# stored as is.
+CODEC_RAW = 0
+CODEC_ZSTD = 1
+
+# Response validators kept with the cache, and the request headers that send
+# them back so an unchanged catalog is answered with 304 Not Modified
+VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+# One TLE record: a name line (not a comment or element line) followed by
+# lines 1 and 2. Surrounding whitespace and CRLF line endings are not captured.
+# Each field is matched greedily up to its last non-space character; lazy
+# quantifiers retried the line ending after every character (~4x slower).
+TLE_RECORD_RE = re.compile(
+    r'^[ \t]*(?![12] |#)(\S(?:[^\r\n]*\S)?)[ \t]*\r?\n'
+    r'[ \t]*(1 (?:[^\r\n]*\S)?)[ \t]*\r?\n'
+    r'[ \t]*(2 (?:[^\r\n]*\S)?)[ \t]*\r?$',
+    re.MULTILINE,
+)
+
+# Most partial-name lookups TLEManager and PositionCalculator remember. Names
+# come from callers, so the memos are emptied when full instead of growing
+# without limit.
+PARTIAL_MATCH_MEMO_SIZE = 1024
+
 # Real satellites to use (ISS, Starlink, GPS, etc.)
 # Using a diverse set of LEO satellites for realistic simulation
-REAL_SATELLITES = [
+REAL_SATELLITES = (
     # ISS (International Space Station)
     "ISS",
     # Starlink satellites (small sample)
@@ -142,10 +207,21 @@ REAL_SATELLITES = [
     "STARLINK-1078",
     "STARLINK-1079",
     "STARLINK-1080",
-]
+)
+
+
+@cache
+def _default_cache_dir() -> Path:
+    """Default TLE cache directory, resolved once per process"""
+    return Path.home() / ".cache" / "orbitstream" / "tle"
+
+
+def _codec_available(codec: int) -> bool:
+    """Whether a cache body stored with codec can be read in this process"""
+    return codec == CODEC_RAW or (codec == CODEC_ZSTD and zstandard is not None)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TLEData:
     """Two-Line Element orbital data for a satellite"""
     name: str
@@ -172,18 +248,27 @@ class TLEManager:
             cache_dir: Directory to cache TLE data (default: ~/.cache/orbitstream/tle)
             cache_expiry_hours: How long to cache TLE data before refreshing (default: 24 hours)
         """
-        if cache_dir is None:
-            cache_dir = Path.home() / ".cache" / "orbitstream" / "tle"
-
-        self.cache_dir = Path(cache_dir)
+        self.cache_dir = _default_cache_dir() if cache_dir is None else Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.cache_file = self.cache_dir / "satellites.tle"
-        self.metadata_file = self.cache_dir / "metadata.json"
         self.cache_expiry_hours = cache_expiry_hours
 
         self._tle_cache: Dict[str, TLEData] = {}
 
+        # ETag / Last-Modified of the catalog in _tle_cache, by response header
+        self._validators: Dict[str, str] = {}
+
+        # Uppercase name index over _tle_cache, built lazily on first lookup.
+        # _indexed_cache records which dict it was built from, so replacing
+        # _tle_cache invalidates it; loaders reset it after refilling.
+        self._upper_index: Optional[Dict[str, TLEData]] = None
+        self._indexed_cache: Optional[Dict[str, TLEData]] = None
+
+        # Partial-match results (including misses) per uppercase key, valid
+        # for the current _upper_index; each miss would otherwise rescan it
+        self._partial_matches: Dict[str, Optional[TLEData]] = {}
+
     def load_tle_data(self, force_refresh: bool = False) -> Dict[str, TLEData]:
         """
         Load TLE data from cache or download fresh data.
@@ -199,14 +284,14 @@ class TLEManager:
             logger.info("Loading TLE data from cache...")
             self._load_from_cache()
             if self._tle_cache:
-                logger.info(f"Loaded {len(self._tle_cache)} satellites from cache")
+                logger.info("Loaded %d satellites from cache", len(self._tle_cache))
                 return self._tle_cache
 
         # Download fresh data
         logger.info("Downloading TLE data from Celestrak...")
-        self._download_tle_data()
-        self._save_to_cache()
-        logger.info(f"Downloaded {len(self._tle_cache)} satellites")
+        if self._download_tle_data():
+            self._save_to_cache()
+            logger.info("Downloaded %d satellites", len(self._tle_cache))
 
         return self._tle_cache
 
@@ -220,16 +305,43 @@ class TLEManager:
         Returns:
             TLEData object or None if not found
         """
+        key = satellite_name.upper()
+        index = self._get_upper_index()
+
         # Try exact match (case-insensitive)
-        for name, tle in self._tle_cache.items():
-            if name.upper() == satellite_name.upper():
-                return tle
+        tle = index.get(key)
+        if tle is not None:
+            return tle
 
-        # Try partial match
-        for name, tle in self._tle_cache.items():
-            if satellite_name.upper() in name.upper():
+        # Try partial match, scanning the index once per distinct key
+        try:
+            return self._partial_matches[key]
+        except KeyError:
+            pass
+
+        tle = self._partial_lookup(index, key)
+        if len(self._partial_matches) >= PARTIAL_MATCH_MEMO_SIZE:
+            self._partial_matches.clear()
+        self._partial_matches[key] = tle
+        return tle
+
+    def _get_upper_index(self) -> Dict[str, TLEData]:
+        """Return the uppercase name index, rebuilding it if the cache changed"""
+        if self._upper_index is None or self._indexed_cache is not self._tle_cache:
+            index: Dict[str, TLEData] = {}
+            for name, tle in self._tle_cache.items():
+                index.setdefault(name.upper(), tle)
+            self._upper_index = index
+            self._indexed_cache = self._tle_cache
+            self._partial_matches = {}
+        return self._upper_index
+
+    @staticmethod
+    def _partial_lookup(index: Dict[str, TLEData], key: str) -> Optional[TLEData]:
+        """Return the first TLE whose uppercase name contains key"""
+        for name, tle in index.items():
+            if key in name:
                 return tle
-
         return None
 
     def get_available_satellites(self) -> list[str]:
@@ -240,8 +352,9 @@ class TLEManager:
         """
         Get a list of real satellite names for simulation.
 
-        Returns the requested number of satellite names from our predefined list.
-        If we have more satellites available than requested, returns a subset.
+        Picks names from our predefined list that have TLE data, then tops
+        up with other cached satellites. If the cache still holds fewer
+        than count satellites, the selection is repeated to fill the list.
 
         Args:
             count: Number of satellite names to return
@@ -253,134 +366,231 @@ class TLEManager:
         if not self._tle_cache:
             self.load_tle_data()
 
-        # Filter to only satellites we have TLE data for
-        available = []
-        for name in REAL_SATELLITES[:count]:
-            if self.get_satellite_tle(name):
+        # Preferred satellites first; seen holds matched cache names so a
+        # partial match never picks the same satellite twice
+        available: list[str] = []
+        seen: set[str] = set()
+        for name in REAL_SATELLITES:
+            if len(available) >= count:
+                break
+            tle = self.get_satellite_tle(name)
+            if tle is not None and tle.name not in seen:
                 available.append(name)
+                seen.add(tle.name)
 
-        # If we don't have enough, cycle through available satellites to fill
-        if available:
-            i = 0
-            while len(available) < count:
-                available.append(available[i % len(available)])
+        # Then any other satellites we have TLE data for
+        if len(available) < count:
+            leftover = (name for name in self._tle_cache if name not in seen)
+            available.extend(islice(leftover, count - len(available)))
 
-        return available[:count]
+        # If we still don't have enough, cycle through available satellites
+        if len(available) < count:
+            available = list(islice(cycle(available), count))
+
+        return available
 
     def _is_cache_valid(self) -> bool:
         """Check if cached TLE data is still valid"""
-        if not self.cache_file.exists():
+        header = self._read_cache_header()
+        if header is None:
             return False
 
-        if not self.metadata_file.exists():
-            return False
+        cached_at = header[0]
+        return time.time() - cached_at < self.cache_expiry_hours * 3600
 
+    def _read_cache_header(self) -> Optional[tuple[int, int, int, str, str]]:
+        """
+        Read the cache file header without reading the TLE text.
+
+        Returns:
+            (cached_at, satellite_count, crc32, etag, last_modified), or None
+            if the file is missing, does not start with a current-version
+            header, or uses a codec that is not installed. Unknown validators
+            are empty strings.
+        """
         try:
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
+            # Unbuffered, so only the header bytes are read
+            with open(self.cache_file, 'rb', buffering=0) as f:
+                header = f.read(CACHE_HEADER.size)
+        except OSError:
+            return None
 
-            cached_time = datetime.fromisoformat(metadata.get('cached_at', ''))
-            age = datetime.now(timezone.utc) - cached_time
+        if len(header) != CACHE_HEADER.size:
+            return None
 
-            return age.total_seconds() < (self.cache_expiry_hours * 3600)
-        except (json.JSONDecodeError, ValueError, KeyError):
-            return False
+        magic, version, codec, cached_at, count, crc, etag, last_modified = (
+            CACHE_HEADER.unpack(header)
+        )
+        if (
+            magic != CACHE_MAGIC
+            or version != CACHE_VERSION
+            or not _codec_available(codec)
+        ):
+            return None
+        return (
+            cached_at, count, crc,
+            etag.rstrip(b"\0").decode('latin-1'),
+            last_modified.rstrip(b"\0").decode('latin-1'),
+        )
 
     def _load_from_cache(self) -> None:
         """Load TLE data from cache file"""
         self._tle_cache.clear()
+        self._validators = {}
 
         try:
-            with open(self.cache_file, 'r') as f:
-                content = f.read()
-
-            # Parse TLE format (3 lines per satellite: name, line1, line2)
-            lines = content.strip().split('\n')
-            i = 0
-            while i < len(lines):
-                name = lines[i].strip()
-                if i + 2 < len(lines):
-                    line1 = lines[i + 1].strip()
-                    line2 = lines[i + 2].strip()
-                    self._tle_cache[name] = TLEData(name, line1, line2)
-                i += 3
-
-        except (IOError, IndexError) as e:
-            logger.warning(f"Failed to load TLE cache: {e}")
+            with open(self.cache_file, 'rb') as f:
+                data = f.read()
+
+            body = memoryview(data)[CACHE_HEADER.size:]
+            magic, version, codec, _, _, crc, etag, last_modified = (
+                CACHE_HEADER.unpack_from(data)
+            )
+            if (
+                magic != CACHE_MAGIC
+                or version != CACHE_VERSION
+                or zlib.crc32(body) != crc
+            ):
+                logger.warning("Ignoring corrupt TLE cache %s", self.cache_file)
+            elif not _codec_available(codec):
+                logger.warning(
+                    "Ignoring TLE cache %s: zstandard is not installed", self.cache_file
+                )
+            else:
+                if codec == CODEC_ZSTD:
+                    # Decompress straight from the view, without copying the body
+                    body = zstandard.ZstdDecompressor().decompress(body)
+
+                for name, value in (("ETag", etag), ("Last-Modified", last_modified)):
+                    value = value.rstrip(b"\0").decode('latin-1')
+                    if value:
+                        self._validators[name] = value
+
+                # The body is exactly what _save_to_cache wrote, so read it as
+                # plain name/line1/line2 triplets instead of re-running the
+                # tolerant TLE_RECORD_RE parse used for downloads
+                lines = iter(str(body, 'utf-8').split('\n'))
+                self._tle_cache.update(
+                    (name, TLEData(name, line1, line2))
+                    for name, line1, line2 in zip(lines, lines, lines)
+                )
+
+        except (IOError, struct.error, UnicodeDecodeError, *_ZSTD_ERRORS) as e:
+            logger.warning("Failed to load TLE cache: %s", e)
             self._tle_cache.clear()
 
+        self._upper_index = None
+
+    def _parse_tle_text(self, content: str) -> None:
+        """Add every well-formed 3-line TLE record in content to the cache"""
+        for name, line1, line2 in TLE_RECORD_RE.findall(content):
+            self._tle_cache[name] = TLEData(name, line1, line2)
+
     def _save_to_cache(self) -> None:
-        """Save TLE data to cache file"""
+        """Save TLE data to cache file, behind a header recording when it was cached"""
         try:
-            # Save TLE data
-            with open(self.cache_file, 'w') as f:
-                for tle in self._tle_cache.values():
-                    f.write(str(tle))
-                    f.write('\n')
-
-            # Save metadata
-            metadata = {
-                'cached_at': datetime.now(timezone.utc).isoformat(),
-                'satellite_count': len(self._tle_cache),
-                'source': CELESTRAK_ACTIVE_URL
-            }
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
-            logger.info(f"Saved {len(self._tle_cache)} satellites to cache")
+            body = "".join(f"{tle}\n" for tle in self._tle_cache.values()).encode()
+            codec = CODEC_RAW
+            if zstandard is not None:
+                body = zstandard.ZstdCompressor(level=1).compress(body)
+                codec = CODEC_ZSTD
+            header = CACHE_HEADER.pack(
+                CACHE_MAGIC, CACHE_VERSION, codec, int(time.time()),
+                len(self._tle_cache), zlib.crc32(body),
+                self._validator_field("ETag"), self._validator_field("Last-Modified"),
+            )
+
+            # Header and TLE text as one buffer in a single write, to a temporary
+            # file renamed over the cache so readers never see a partial file.
+            # No fsync: a cache lost to a crash is simply downloaded again.
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(header + body)
+            os.replace(tmp_file, self.cache_file)
+
+            logger.info("Saved %d satellites to cache", len(self._tle_cache))
 
         except IOError as e:
-            logger.warning(f"Failed to save TLE cache: {e}")
+            logger.warning("Failed to save TLE cache: %s", e)
+
+    def _validator_field(self, name: str) -> bytes:
+        """Encode a response validator for the cache header, b"" if it does not fit"""
+        value = self._validators.get(name, "").encode('latin-1')
+        return value if len(value) <= 64 else b""
+
+    def _touch_cache(self) -> None:
+        """Mark the cache file as fresh by rewriting the timestamp in its header"""
+        try:
+            with open(self.cache_file, 'r+b') as f:
+                fields = list(CACHE_HEADER.unpack(f.read(CACHE_HEADER.size)))
+                fields[3] = int(time.time())
+                f.seek(0)
+                f.write(CACHE_HEADER.pack(*fields))
+        except (IOError, struct.error) as e:
+            logger.warning("Failed to update TLE cache timestamp: %s", e)
+
+    def _download_tle_data(self) -> bool:
+        """
+        Download TLE data from Celestrak.
+
+        Transient failures are retried (see DOWNLOAD_RETRY) before falling
+        back to built-in TLEs. When the cache file records an ETag or
+        Last-Modified, the request is conditional; if Celestrak answers
+        304 Not Modified, the cached TLEs are loaded and only the cache
+        timestamp is refreshed.
 
-    def _download_tle_data(self) -> None:
-        """Download TLE data from Celestrak"""
+        Returns:
+            True if _tle_cache holds downloaded (or fallback) data that still
+            needs saving, False if it was revalidated from the cache file
+        """
         self._tle_cache.clear()
 
+        header = self._read_cache_header()
+        conditional = {}
+        if header is not None:
+            for name, value in zip(VALIDATOR_HEADERS, header[3:]):
+                if value:
+                    conditional[VALIDATOR_HEADERS[name]] = value
+
         try:
-            response = requests.get(CELESTRAK_ACTIVE_URL, timeout=30)
+            with requests.Session() as session:
+                session.mount("https://", HTTPAdapter(max_retries=DOWNLOAD_RETRY))
+
+                response = session.get(
+                    CELESTRAK_ACTIVE_URL, headers=conditional, timeout=DOWNLOAD_TIMEOUT
+                )
+                if response.status_code == 304:
+                    self._load_from_cache()
+                    if self._tle_cache:
+                        self._touch_cache()
+                        logger.info("TLE data not modified since it was cached")
+                        return False
+
+                    # The cached copy turned out unreadable, so fetch it in full
+                    response = session.get(CELESTRAK_ACTIVE_URL, timeout=DOWNLOAD_TIMEOUT)
+
             response.raise_for_status()
 
-            content = response.text
-            lines = content.strip().split('\n')
-
-            # Parse TLE format
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    i += 1
-                    continue
-
-                # Check if this is a satellite name line
-                # (doesn't start with '1 ' or '2 ')
-                if not line.startswith('1 ') and not line.startswith('2 '):
-                    name = line
-                    if i + 2 < len(lines):
-                        line1 = lines[i + 1].strip()
-                        line2 = lines[i + 2].strip()
-
-                        # Validate TLE format
-                        if line1.startswith('1 ') and line2.startswith('2 '):
-                            self._tle_cache[name] = TLEData(name, line1, line2)
-                            i += 3
-                        else:
-                            i += 1
-                    else:
-                        i += 1
-                else:
-                    i += 1
-
-            logger.info(f"Downloaded {len(self._tle_cache)} satellite TLEs")
+            self._parse_tle_text(response.text)
+            self._validators = {
+                name: response.headers[name]
+                for name in VALIDATOR_HEADERS if name in response.headers
+            }
+
+            logger.info("Downloaded %d satellite TLEs", len(self._tle_cache))
 
         except requests.RequestException as e:
-            logger.error(f"Failed to download TLE data: {e}")
+            logger.error("Failed to download TLE data: %s", e)
 
             # Fall back to a minimal set of known satellites
             logger.warning("Using fallback TLE data for ISS")
+            self._tle_cache.clear()
+            self._validators = {}
             self._add_fallback_tle()
 
+        self._upper_index = None
+        return True
+
     def _add_fallback_tle(self) -> None:
         """Add fallback TLE data for ISS in case download fails"""
         # ISS TLE (updated periodically - this is a sample)
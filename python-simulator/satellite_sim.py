@@ -6,18 +6,25 @@ Generates high-throughput telemetry data and sends to Go ingestion service
 
 import argparse
 import asyncio
+import json
 import logging
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
 import aiohttp
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from config import SimulatorConfig
-from generators.telemetry_gen import TelemetryGenerator
+from generators.position_calc import POSITION_FIELDS, PositionCalculator
+from generators.telemetry_gen import TelemetryFleet, TelemetryGenerator
 from generators.tle_manager import TLEManager
-from generators.position_calc import PositionCalculator
 
 # Configure logging
 logging.basicConfig(
@@ -26,72 +33,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Request bodies are pre-serialized bytes, so the content type is set by hand
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class IsoClock:
+    """Current UTC time as an ISO 8601 string, formatted at most once per millisecond"""
+
+    def __init__(self):
+        self._ms = -1
+        self._iso = ""
+
+    def now(self) -> str:
+        """Return the current time, reusing the string within the same millisecond"""
+        ms = time.time_ns() // 1_000_000
+        if ms != self._ms:
+            self._ms = ms
+            self._iso = datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat(
+                timespec="milliseconds"
+            )
+        return self._iso
+
+
+# Shared by all satellites so concurrent sends reuse each formatted timestamp
+CLOCK = IsoClock()
+
 
-@dataclass
+@dataclass(slots=True)
 class Satellite:
-    """Represents a single satellite"""
+    """
+    Represents a single satellite.
+
+    A standalone satellite draws its readings from its own generator. In a
+    SatelliteSwarm the readings of all satellites come from one
+    TelemetryFleet instead, and generator is None.
+    """
     id: str
-    generator: TelemetryGenerator
+    generator: Optional[TelemetryGenerator] = None
 
-    async def send_telemetry(self, session: aiohttp.ClientSession,
-                            config: SimulatorConfig) -> dict:
-        """Send a single telemetry point with optional position data"""
-        telemetry = self.generator.generate_telemetry()
+    # Payload prefix, built in __post_init__
+    _prefix: str = field(init=False, repr=False, compare=False, default="")
 
-        payload = {
-            "satellite_id": self.id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "battery_charge_percent": telemetry["battery"],
-            "storage_usage_mb": telemetry["storage"],
-            "signal_strength_dbm": telemetry["signal"]
-        }
+    # Send outcomes, folded into the swarm stats by SatelliteSwarm.flush_stats
+    _local_sent: int = field(init=False, repr=False, compare=False, default=0)
+    _local_ok: int = field(init=False, repr=False, compare=False, default=0)
+    _local_err: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self):
+        # Every payload starts with the same satellite_id, so serialize it once:
+        # '{"satellite_id":"SAT-0001","timestamp":"'
+        self._prefix = json.dumps({"satellite_id": self.id}, separators=(",", ":"))[:-1]
+        self._prefix += ',"timestamp":"'
+
+    def build_payload(self) -> bytes:
+        """Generate one telemetry point with this satellite's generator"""
+        telemetry = self.generator.generate_telemetry()
+        position = "".join(
+            f',"{field}":{telemetry[field]}'
+            for field in POSITION_FIELDS
+            if field in telemetry
+        )
+        reading = (telemetry["battery"], telemetry["storage"], telemetry["signal"])
+        return self.format_payload(CLOCK.now(), reading, position)
+
+    def format_payload(self, timestamp: str, reading: Sequence[float],
+                       position: str = "") -> bytes:
+        """
+        Format one telemetry point as a JSON-encoded API payload.
+
+        Args:
+            timestamp: ISO 8601 time of the reading, see IsoClock
+            reading: Battery, storage and signal values, already rounded
+            position: Position members to append, each starting with a
+                comma; empty when the satellite has no position
+
+        Returns:
+            UTF-8 encoded JSON object
+        """
+        battery, storage, signal = reading
+
+        # Only the values vary; keys and satellite_id are baked into strings
+        return (
+            f'{self._prefix}{timestamp}"'
+            f',"battery_charge_percent":{battery}'
+            f',"storage_usage_mb":{storage}'
+            f',"signal_strength_dbm":{signal}'
+            f'{position}}}'
+        ).encode()
 
-        # Add position fields if available
-        if "latitude" in telemetry:
-            payload["latitude"] = telemetry["latitude"]
-        if "longitude" in telemetry:
-            payload["longitude"] = telemetry["longitude"]
-        if "altitude_km" in telemetry:
-            payload["altitude_km"] = telemetry["altitude_km"]
-        if "velocity_kmph" in telemetry:
-            payload["velocity_kmph"] = telemetry["velocity_kmph"]
+    async def send_telemetry(self, session: aiohttp.ClientSession,
+                            config: SimulatorConfig,
+                            payload: Optional[bytes] = None) -> dict:
+        """Send one telemetry point, generating it with build_payload() if not given"""
+        if payload is None:
+            payload = self.build_payload()
+        self._local_sent += 1
 
         try:
             async with session.post(
                 f"{config.api_url}/telemetry",
-                json=payload,
+                data=payload,
+                headers=JSON_HEADERS,
                 timeout=aiohttp.ClientTimeout(total=5)
             ) as response:
                 if response.status == 202:
+                    self._local_ok += 1
                     return {"status": "success", "satellite": self.id}
                 else:
+                    self._local_err += 1
                     return {"status": "error", "code": response.status}
         except Exception as e:
+            self._local_err += 1
             return {"status": "error", "message": str(e)}
 
-    async def continuous_send(self, session: aiohttp.ClientSession,
-                             config: SimulatorConfig,
-                             stats: dict):
-        """Continuously send telemetry at target rate"""
-        interval = 1.0 / config.points_per_second_per_satellite
-
-        while config.running:
-            start_time = time.time()
-
-            result = await self.send_telemetry(session, config)
-
-            # Update statistics
-            stats["total_sent"] += 1
-            if result["status"] == "success":
-                stats["success"] += 1
-            else:
-                stats["errors"] += 1
-
-            # Maintain exact timing
-            elapsed = time.time() - start_time
-            sleep_time = max(0, interval - elapsed)
-            await asyncio.sleep(sleep_time)
-
 
 class SatelliteSwarm:
     """Manages multiple satellites sending data concurrently"""
@@ -103,7 +157,7 @@ class SatelliteSwarm:
             "total_sent": 0,
             "success": 0,
             "errors": 0,
-            "start_time": time.time()
+            "start_time": time.monotonic()  # Monotonic: elapsed never jumps with NTP
         }
 
         # Initialize TLE manager and position calculator for real satellite positions
@@ -113,33 +167,39 @@ class SatelliteSwarm:
             tle_manager = TLEManager()
             tle_data = tle_manager.load_tle_data()
             self.position_calculator = PositionCalculator(tle_data)
-            logger.info(f"Position calculator initialized with {len(tle_data)} satellites")
+            logger.info("Position calculator initialized with %d satellites", len(tle_data))
         except Exception as e:
-            logger.warning(f"Failed to initialize position calculator: {e}")
+            logger.warning("Failed to initialize position calculator: %s", e)
             logger.warning("Continuing without position tracking")
 
-        # Get real satellite names
-        satellite_names = self._get_satellite_names(config.num_satellites)
-
-        # Initialize satellites with real orbital data
-        for i in range(config.num_satellites):
-            sat_id = f"SAT-{i+1:04d}"
-            sat_name = satellite_names[i] if i < len(satellite_names) else None
-
-            generator = TelemetryGenerator(
-                base_battery=100.0,
-                base_storage=0.0,
-                base_signal=-50.0,
-                anomaly_rate=config.anomaly_rate,
-                satellite_name=sat_name,
-                position_calculator=self.position_calculator
-            )
-            self.satellites.append(Satellite(sat_id, generator))
+        # Real satellites whose orbits the first satellites follow, in order
+        self.orbit_names = self._get_satellite_names(config.num_satellites)[
+            :config.num_satellites
+        ]
+
+        # Interned: each id is reused as a key and in every result dict
+        sat_ids = map(sys.intern, map("SAT-{:04d}".format, range(1, config.num_satellites + 1)))
+        self.satellites.extend(map(Satellite, sat_ids))
+
+        # Readings for every satellite, advanced together once per tick
+        self.fleet = TelemetryFleet(
+            config.num_satellites,
+            base_battery=100.0,
+            base_storage=0.0,
+            base_signal=-50.0,
+            anomaly_rate=config.anomaly_rate,
+        )
+
+        # Position members of each satellite's payload and the wall-clock
+        # second they were computed for. Positions barely move within a
+        # second, so faster send rates reuse them.
+        self._positions = [""] * config.num_satellites
+        self._positions_second: Optional[int] = None
 
         if self.position_calculator:
-            logger.info(f"Initialized {len(self.satellites)} satellites with real orbital positions")
+            logger.info("Initialized %d satellites with real orbital positions", len(self.satellites))
         else:
-            logger.info(f"Initialized {len(self.satellites)} satellites (no position tracking)")
+            logger.info("Initialized %d satellites (no position tracking)", len(self.satellites))
 
     def _get_satellite_names(self, count: int) -> list[str]:
         """Get list of real satellite names for simulation"""
@@ -152,8 +212,11 @@ class SatelliteSwarm:
 
     async def start(self):
         """Start all satellites"""
-        logger.info(f"Starting swarm of {len(self.satellites)} satellites")
-        logger.info(f"Target throughput: {self.config.num_satellites * self.config.points_per_second_per_satellite} points/sec")
+        logger.info("Starting swarm of %d satellites", len(self.satellites))
+        logger.info(
+            "Target throughput: %d points/sec",
+            self.config.num_satellites * self.config.points_per_second_per_satellite
+        )
 
         # Configure aiohttp connector for high concurrency
         connector = aiohttp.TCPConnector(
@@ -173,40 +236,182 @@ class SatelliteSwarm:
             connector=connector,
             timeout=timeout
         ) as session:
-            # Create tasks for all satellites
-            tasks = [
-                sat.continuous_send(
-                    session,
-                    self.config,
-                    self.stats
-                )
-                for sat in self.satellites
-            ]
+            config = self.config
+            queue: Optional[asyncio.Queue] = None
+            senders = []
+            if config.batch_size > 1:
+                # The scheduler queues points; a few senders POST them in batches
+                queue = asyncio.Queue(maxsize=config.batch_size * config.batch_senders * 2)
+                senders = [
+                    asyncio.create_task(self.send_batches(session, queue))
+                    for _ in range(config.batch_senders)
+                ]
 
             # Start statistics reporter
-            stats_task = asyncio.create_task(self.report_stats())
+            background = [asyncio.create_task(self.report_stats()), *senders]
+
+            try:
+                await self.run_scheduler(session, queue)
+            finally:
+                # Cancel background tasks
+                for task in background:
+                    task.cancel()
+
+    async def run_scheduler(self, session: aiohttp.ClientSession,
+                            queue: Optional[asyncio.Queue]):
+        """
+        Pace the whole swarm from one loop: one reading per satellite per tick.
+
+        A single sleep per tick replaces one timer per satellite. Points are
+        queued for the batch senders, or sent individually when queue is None.
+        Individual sends run as tasks, so a slow request only holds back its
+        own satellite, which skips ticks until that request completes.
+        """
+        config = self.config
+        interval = 1.0 / config.points_per_second_per_satellite
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        # Individual sends still in flight, by satellite id
+        sending: dict[str, asyncio.Task] = {}
+
+        try:
+            while not config.stop.is_set():
+                payloads = self.tick_payloads()
+
+                if queue is not None:
+                    # Blocks when senders fall behind, throttling generation
+                    for payload in payloads:
+                        await queue.put(payload)
+                else:
+                    # Outcomes are counted on each satellite; see flush_stats.
+                    # A satellite still sending drops this tick's reading.
+                    for sat, payload in zip(self.satellites, payloads):
+                        if sat.id not in sending:
+                            task = asyncio.create_task(
+                                sat.send_telemetry(session, config, payload)
+                            )
+                            sending[sat.id] = task
+                            task.add_done_callback(lambda _, key=sat.id: sending.pop(key))
+
+                # Schedule against absolute tick times; don't bank time when behind
+                next_tick = max(next_tick + interval, loop.time())
+                await asyncio.sleep(next_tick - loop.time())
+        finally:
+            # Let in-flight sends finish while the session is still open
+            if sending:
+                await asyncio.gather(*sending.values(), return_exceptions=True)
+
+    async def send_batches(self, session: aiohttp.ClientSession, queue: asyncio.Queue):
+        """Drain queued points into POST /telemetry/batch requests"""
+        config = self.config
+        url = f"{config.api_url}/telemetry/batch"
+
+        while not config.stop.is_set():
+            batch = [await queue.get()]
+
+            # Give a partial batch up to batch_interval to fill
+            if queue.qsize() < config.batch_size - 1:
+                await asyncio.sleep(config.batch_interval)
+            while len(batch) < config.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            await self.post_batch(session, url, batch)
+
+    async def post_batch(self, session: aiohttp.ClientSession, url: str, batch: list[bytes]):
+        """POST one batch of JSON-encoded points and record the outcome in stats"""
+        self.stats["total_sent"] += len(batch)
+        accepted = 0
 
-            # Run all satellite tasks
-            await asyncio.gather(*tasks)
+        try:
+            async with session.post(
+                url,
+                data=b"[" + b",".join(batch) + b"]",
+                headers=JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 202:
+                    body = await response.json()
+                    # The service omits "count" when it is zero (omitempty)
+                    accepted = min(len(batch), body.get("count", 0))
+        except Exception:
+            pass
+
+        self.stats["success"] += accepted
+        self.stats["errors"] += len(batch) - accepted
+
+    def tick_payloads(self) -> list[bytes]:
+        """
+        Generate this tick's payload for every satellite.
+
+        Readings come from one TelemetryFleet.tick() and positions from one
+        batched propagation per second, instead of one generator and one
+        propagation per satellite.
+
+        Returns:
+            One JSON-encoded payload per satellite, in self.satellites order
+        """
+        readings = self.fleet.tick().tolist()
+        now = time.time()
+        self._refresh_positions(now)
+        timestamp = CLOCK.now()
+        positions = self._positions
+        return [
+            sat.format_payload(timestamp, reading, position)
+            for sat, reading, position in zip(self.satellites, readings, positions)
+        ]
+
+    def _refresh_positions(self, now: float) -> None:
+        """Propagate every tracked satellite at once, at most once per second"""
+        second = int(now)
+        if not self.orbit_names or second == self._positions_second:
+            return
+        self._positions_second = second
+
+        calc = self.position_calculator
+        positions = calc.get_positions_at(self.orbit_names, calc.time_at(now))
+        for i, position in enumerate(positions):
+            # Keep the last known position when propagation fails
+            if position is not None:
+                self._positions[i] = (
+                    f',"latitude":{round(position.latitude, 6)}'
+                    f',"longitude":{round(position.longitude, 6)}'
+                    f',"altitude_km":{round(position.altitude_km, 2)}'
+                    f',"velocity_kmph":{round(position.velocity_kmph, 2)}'
+                )
 
-            # Cancel stats task
-            stats_task.cancel()
+    def flush_stats(self):
+        """Fold each satellite's local send counters into the shared stats"""
+        stats = self.stats
+        for sat in self.satellites:
+            stats["total_sent"] += sat._local_sent
+            stats["success"] += sat._local_ok
+            stats["errors"] += sat._local_err
+            sat._local_sent = sat._local_ok = sat._local_err = 0
 
     async def report_stats(self):
         """Periodically report throughput statistics"""
-        while self.config.running:
-            await asyncio.sleep(5)  # Report every 5 seconds
-
-            elapsed = time.time() - self.stats["start_time"]
+        stop = self.config.stop
+        while not stop.is_set():
+            # Report every 5 seconds, or return as soon as the swarm stops
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=5)
+                return
+            except TimeoutError:
+                pass
+            self.flush_stats()
+
+            elapsed = time.monotonic() - self.stats["start_time"]
             throughput = self.stats["total_sent"] / elapsed
             success_rate = (self.stats["success"] / self.stats["total_sent"] * 100
                           if self.stats["total_sent"] > 0 else 0)
 
             logger.info(
-                f"Throughput: {throughput:.0f} pts/sec | "
-                f"Total: {self.stats['total_sent']:,} | "
-                f"Success: {success_rate:.1f}% | "
-                f"Errors: {self.stats['errors']:,}"
+                "Throughput: %.0f pts/sec | Total: %s | Success: %.1f%% | Errors: %s",
+                throughput,
+                format(self.stats["total_sent"], ","),
+                success_rate,
+                format(self.stats["errors"], ","),
             )
 
 
@@ -245,6 +450,12 @@ async def main():
         default=0.01,
         help="Probability of generating anomalous data (default: 0.01 = 1%%)"
     )
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        default=50,
+        help="Points per batch request (default: 50, 1 = one request per point)"
+    )
 
     args = parser.parse_args()
 
@@ -256,14 +467,15 @@ async def main():
         duration_seconds=args.duration,
         max_connections=1000,
         max_connections_per_host=500,
-        anomaly_rate=args.anomaly_rate
+        anomaly_rate=args.anomaly_rate,
+        batch_size=args.batch_size
     )
 
-    logger.info(f"Configuration: {args.satellites} satellites @ {args.rate} pts/sec each")
-    logger.info(f"Total target throughput: {args.satellites * args.rate:,} pts/sec")
+    logger.info("Configuration: %d satellites @ %d pts/sec each", args.satellites, args.rate)
+    logger.info("Total target throughput: %s pts/sec", format(args.satellites * args.rate, ","))
 
-    # Create and start swarm
-    swarm = SatelliteSwarm(config)
+    # Create swarm off the event loop: loading TLEs may block on a download
+    swarm = await asyncio.to_thread(SatelliteSwarm, config)
 
     try:
         if config.duration_seconds > 0:
@@ -277,10 +489,11 @@ async def main():
     except TimeoutError:
         logger.info("Duration elapsed, shutting down...")
     finally:
-        config.running = False
+        config.stop.set()
 
         # Final statistics
-        elapsed = time.time() - swarm.stats["start_time"]
+        swarm.flush_stats()
+        elapsed = time.monotonic() - swarm.stats["start_time"]
         throughput = swarm.stats["total_sent"] / elapsed
         success_rate = (swarm.stats["success"] / swarm.stats["total_sent"] * 100
                        if swarm.stats["total_sent"] > 0 else 0)
@@ -288,14 +501,17 @@ async def main():
         logger.info("=" * 60)
         logger.info("FINAL STATISTICS")
         logger.info("=" * 60)
-        logger.info(f"Duration: {elapsed:.1f} seconds")
-        logger.info(f"Total Points Sent: {swarm.stats['total_sent']:,}")
-        logger.info(f"Successful: {swarm.stats['success']:,}")
-        logger.info(f"Errors: {swarm.stats['errors']:,}")
-        logger.info(f"Average Throughput: {throughput:.0f} pts/sec")
-        logger.info(f"Success Rate: {success_rate:.2f}%")
+        logger.info("Duration: %.1f seconds", elapsed)
+        logger.info("Total Points Sent: %s", format(swarm.stats['total_sent'], ","))
+        logger.info("Successful: %s", format(swarm.stats['success'], ","))
+        logger.info("Errors: %s", format(swarm.stats['errors'], ","))
+        logger.info("Average Throughput: %.0f pts/sec", throughput)
+        logger.info("Success Rate: %.2f%%", success_rate)
         logger.info("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional: a faster drop-in event loop when it is installed
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -1,18 +1,23 @@
 """
 Shared pytest fixtures for satellite simulator tests
 """
-from unittest.mock import Mock, patch
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from skyfield.api import load
 
 from config import SimulatorConfig
 from generators.telemetry_gen import TelemetryGenerator
-from generators.tle_manager import TLEData
-from generators.position_calc import PositionData
+from generators.tle_manager import TLEData, TLEManager
+from generators.position_calc import PositionCalculator, PositionData
+from satellite_sim import SatelliteSwarm
 
 
-# Mock TLE data to prevent network calls during tests
-MOCK_TLE_DATA = {
+# Sample TLEs shared by all tests, read-only so a session can share them
+SAMPLE_TLE_DATA = MappingProxyType({
     "ISS": TLEData(
         "ISS",
         "1 25544U 98067A   24010.50000000  .00010000  00000-0  18000-3 0  9998",
@@ -23,10 +28,20 @@ MOCK_TLE_DATA = {
         "1 28654U 05018A   24010.50000000  .00000000  00000-0  00000-0 0  9998",
         "2 28654  99.1000 200.0000 0014000 100.0000 260.0000 14.10000000450000"
     ),
-}
+    "STARLINK-1001": TLEData(
+        "STARLINK-1001",
+        "1 44713U 19062A   24010.50000000  .00000000  00000-0  00000-0 0  9998",
+        "2 44713  53.0000 100.0000 0001000 100.0000 260.0000 15.00000000500000"
+    ),
+})
+
+# Mock TLE data to prevent network calls during tests
+MOCK_TLE_DATA = {name: SAMPLE_TLE_DATA[name] for name in ("ISS", "NOAA-18")}
 
 
-@pytest.fixture
+# The two mocks below are configured once per session; mock_tle_and_position
+# clears their call history so each test starts from a clean record.
+@pytest.fixture(scope="session")
 def mock_tle_manager():
     """Mock TLEManager to prevent network calls during tests"""
     mock = Mock()
@@ -37,7 +52,7 @@ def mock_tle_manager():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_position_calculator():
     """Mock PositionCalculator to prevent network calls during tests"""
     mock = Mock()
@@ -47,6 +62,10 @@ def mock_position_calculator():
         altitude_km=408.5,
         velocity_kmph=27576.5
     )
+    mock.get_position_at.return_value = mock.get_position.return_value
+    mock.get_positions_at.side_effect = (
+        lambda names, t: [mock.get_position.return_value] * len(names)
+    )
     mock.get_velocity.return_value = 27576.5
     mock.is_satellite_visible.return_value = True
     mock.get_available_satellites.return_value = list(MOCK_TLE_DATA.keys())
@@ -54,16 +73,69 @@ def mock_position_calculator():
     return mock
 
 
-@pytest.fixture
-def mock_tle_and_position(mock_tle_manager, mock_position_calculator):
-    """Combined fixture that mocks both TLEManager and PositionCalculator"""
+@contextmanager
+def _patch_tle_and_position(mock_tle_manager, mock_position_calculator):
+    """Patch TLEManager and PositionCalculator wherever the simulator imports them"""
     with patch('generators.tle_manager.TLEManager', return_value=mock_tle_manager), \
          patch('generators.position_calc.PositionCalculator', return_value=mock_position_calculator), \
          patch('satellite_sim.TLEManager', return_value=mock_tle_manager), \
          patch('satellite_sim.PositionCalculator', return_value=mock_position_calculator):
+        yield
+
+
+@pytest.fixture
+def mock_tle_and_position(mock_tle_manager, mock_position_calculator):
+    """Combined fixture that mocks both TLEManager and PositionCalculator"""
+    mock_tle_manager.reset_mock()
+    mock_position_calculator.reset_mock()
+    with _patch_tle_and_position(mock_tle_manager, mock_position_calculator):
         yield mock_tle_manager, mock_position_calculator
 
 
+# Session-scoped: building a PositionCalculator loads the Skyfield timescale
+# and parses every TLE, so tests share one. Tests must treat these as
+# read-only; test_tle_manager.py overrides sample_tle_data with a mutable
+# copy because the manager clears and refills the dict it is given.
+@pytest.fixture(scope="session")
+def sample_tle_data():
+    """Sample TLE data for testing"""
+    return SAMPLE_TLE_DATA
+
+
+@pytest.fixture(scope="module")
+def loaded_tle_manager(tmp_path_factory):
+    """TLEManager holding the sample TLE data, shared by read-only lookup tests"""
+    manager = TLEManager(cache_dir=tmp_path_factory.mktemp("tle"), cache_expiry_hours=24)
+    manager._tle_cache = dict(SAMPLE_TLE_DATA)
+    return manager
+
+
+@pytest.fixture(scope="session")
+def skyfield_ts():
+    """Skyfield timescale from the bundled leap-second and Delta T tables"""
+    return load.timescale(builtin=True)
+
+
+@pytest.fixture(scope="session")
+def position_calculator(sample_tle_data, skyfield_ts):
+    """Create a PositionCalculator with sample TLE data"""
+    return PositionCalculator(sample_tle_data, ts=skyfield_ts)
+
+
+@pytest.fixture(scope="session")
+def sample_timestamp():
+    """Sample timestamp for testing"""
+    return datetime(2024, 2, 10, 15, 30, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def iss_position(position_calculator, sample_timestamp):
+    """ISS position at sample_timestamp, computed once for read-only checks"""
+    return position_calculator.get_position("ISS", sample_timestamp)
+
+
+# Generator fixtures stay function-scoped: generating a reading advances the
+# generator's random walk, and some tests also set its state directly.
 @pytest.fixture
 def telemetry_generator():
     """Create a TelemetryGenerator with default parameters"""
@@ -75,6 +147,21 @@ def telemetry_generator():
     )
 
 
+@pytest.fixture(scope="session")
+def anomaly_batch():
+    """10000 readings at a 100% anomaly rate, read-only and shared by anomaly checks"""
+    batch = TelemetryGenerator(anomaly_rate=1.0).generate_batch(10_000)
+    for values in batch.values():
+        values.flags.writeable = False
+    return batch
+
+
+@pytest.fixture(scope="module")
+def sample_telemetry():
+    """One reading from a default TelemetryGenerator, shared by read-only checks"""
+    return TelemetryGenerator().generate_telemetry()
+
+
 @pytest.fixture
 def telemetry_generator_no_anomalies():
     """Create a TelemetryGenerator with zero anomaly rate"""
@@ -86,6 +173,12 @@ def telemetry_generator_no_anomalies():
     )
 
 
+@pytest.fixture
+def seeded_generator():
+    """Create a TelemetryGenerator with no anomalies and a fixed seed"""
+    return TelemetryGenerator(anomaly_rate=0.0, seed=123)
+
+
 @pytest.fixture
 def telemetry_generator_high_anomaly_rate():
     """Create a TelemetryGenerator with 100% anomaly rate for testing"""
@@ -97,15 +190,63 @@ def telemetry_generator_high_anomaly_rate():
     )
 
 
+@pytest.fixture(scope="module")
+def mock_aiohttp_session():
+    """Mock aiohttp session whose post() always answers 202; returns (session, response)"""
+    response = Mock()
+    response.status = 202
+    response.json = AsyncMock(return_value={"status": "accepted"})
+
+    # MagicMock supports "async with"; __aenter__ is an AsyncMock
+    session = Mock()
+    session.post = MagicMock()
+    session.post.return_value.__aenter__.return_value = response
+    return session, response
+
+
+# Keyword arguments of the SimulatorConfig used by simulator tests
+SIMULATOR_CONFIG = MappingProxyType(dict(
+    num_satellites=5,
+    points_per_second_per_satellite=10,
+    api_url="http://localhost:8080",
+    duration_seconds=1,
+    max_connections=100,
+    max_connections_per_host=50,
+    anomaly_rate=0.01,
+))
+
+
+# Function-scoped: tests set its stop event and tweak batching settings
 @pytest.fixture
 def simulator_config():
     """Create a SimulatorConfig for testing"""
-    return SimulatorConfig(
-        num_satellites=5,
-        points_per_second_per_satellite=10,
-        api_url="http://localhost:8080",
-        duration_seconds=1,
-        max_connections=100,
-        max_connections_per_host=50,
-        anomaly_rate=0.01
-    )
+    return SimulatorConfig(**SIMULATOR_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def shared_swarm(mock_tle_manager, mock_position_calculator):
+    """
+    Build read-only SatelliteSwarms once per module.
+
+    Returns a function taking SimulatorConfig overrides, e.g.
+    shared_swarm(num_satellites=1000); each distinct set of overrides is
+    built once. Tests that run, tick or otherwise mutate a swarm must build
+    their own.
+    """
+    swarms = {}
+
+    def build(**overrides):
+        key = tuple(sorted(overrides.items()))
+        if key not in swarms:
+            config = SimulatorConfig(**{**SIMULATOR_CONFIG, **overrides})
+            with _patch_tle_and_position(mock_tle_manager, mock_position_calculator):
+                swarms[key] = SatelliteSwarm(config)
+        return swarms[key]
+
+    return build
+
+
+@pytest.fixture(scope="module")
+def built_swarm(shared_swarm):
+    """Read-only SatelliteSwarm built from SIMULATOR_CONFIG"""
+    return shared_swarm()
@@ -3,55 +3,23 @@ Tests for the Position Calculator class
 
 Tests for satellite position calculation using TLE data and Skyfield library.
 """
+import dataclasses
 from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
-from skyfield.api import EarthSatellite
 
-from generators.position_calc import PositionCalculator, PositionData, create_position_manager
+from generators import position_calc as position_calc_module
+from generators.position_calc import (
+    ELEMENT_FIELDS,
+    PositionCalculator,
+    PositionData,
+    create_position_manager,
+)
 from generators.tle_manager import TLEData
 
 
-# =============================================================================
-# Test Fixtures
-# =============================================================================
-
-
-@pytest.fixture
-def sample_tle_data():
-    """Sample TLE data for testing"""
-    return {
-        "ISS": TLEData(
-            "ISS",
-            "1 25544U 98067A   24010.50000000  .00010000  00000-0  18000-3 0  9998",
-            "2 25544  51.6416 250.0000 0005000 200.0000 150.0000 15.50000000420000"
-        ),
-        "NOAA-18": TLEData(
-            "NOAA-18",
-            "1 28654U 05018A   24010.50000000  .00000000  00000-0  00000-0 0  9998",
-            "2 28654  99.1000 200.0000 0014000 100.0000 260.0000 14.10000000450000"
-        ),
-        "STARLINK-1001": TLEData(
-            "STARLINK-1001",
-            "1 44713U 19062A   24010.50000000  .00000000  00000-0  00000-0 0  9998",
-            "2 44713  53.0000 100.0000 0001000 100.0000 260.0000 15.00000000500000"
-        ),
-    }
-
-
-@pytest.fixture
-def position_calculator(sample_tle_data):
-    """Create a PositionCalculator with sample TLE data"""
-    return PositionCalculator(sample_tle_data)
-
-
-@pytest.fixture
-def sample_timestamp():
-    """Sample timestamp for testing"""
-    return datetime(2024, 2, 10, 15, 30, 0, tzinfo=timezone.utc)
-
-
 # =============================================================================
 # Test PositionData
 # =============================================================================
@@ -81,11 +49,17 @@ class TestPositionData:
             altitude_km=408.5,
             velocity_kmph=27576.5
         )
-        repr_str = repr(pos)
-        assert "40.7128" in repr_str
-        assert "-74.0060" in repr_str
-        assert "408.50" in repr_str
-        assert "27576.50" in repr_str
+        assert repr(pos) == (
+            "PositionData(lat=40.7128, lon=-74.0060, alt=408.50km, vel=27576.50km/h)"
+        )
+
+
+    def test_position_data_is_immutable(self):
+        """Test that PositionData fields cannot be reassigned"""
+        pos = PositionData(latitude=1.0, longitude=2.0, altitude_km=400.0, velocity_kmph=27000.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pos.latitude = 3.0
+        assert not hasattr(pos, "__dict__")
 
 
 # =============================================================================
@@ -96,11 +70,10 @@ class TestPositionData:
 class TestPositionCalculatorInitialization:
     """Tests for PositionCalculator initialization"""
 
-    def test_initialization_with_tle_data(self, sample_tle_data):
+    def test_initialization_with_tle_data(self, position_calculator, sample_tle_data):
         """Test initialization with TLE data"""
-        calc = PositionCalculator(sample_tle_data)
-        assert calc.tle_data == sample_tle_data
-        assert isinstance(calc.satellites, dict)
+        assert position_calculator.tle_data == sample_tle_data
+        assert isinstance(position_calculator.satellites, dict)
 
     def test_loads_satellites_from_tle(self, position_calculator):
         """Test that satellites are loaded from TLE data"""
@@ -108,6 +81,16 @@ class TestPositionCalculatorInitialization:
         assert len(position_calculator.satellites) > 0
         assert "ISS" in position_calculator.satellites
 
+    def test_elements_array_has_row_per_satellite(self, position_calculator):
+        """Test that orbital elements are decoded once into a contiguous array"""
+        elements = position_calculator.elements
+        assert elements.shape == (len(position_calculator.satellites), len(ELEMENT_FIELDS))
+        assert elements.dtype == np.float64
+
+        iss = elements[position_calculator._element_rows["ISS"]]
+        assert iss[ELEMENT_FIELDS.index("satnum")] == 25544
+        assert np.degrees(iss[ELEMENT_FIELDS.index("inclo")]) == pytest.approx(51.64, abs=0.01)
+
     def test_earth_radius_constant(self):
         """Test Earth radius constant"""
         assert PositionCalculator.EARTH_RADIUS_KM == 6371.0
@@ -116,6 +99,10 @@ class TestPositionCalculatorInitialization:
         """Test that Skyfield timescale is loaded"""
         assert position_calculator.ts is not None
 
+    def test_uses_given_timescale(self, position_calculator, skyfield_ts):
+        """Test that a timescale passed in is shared rather than reloaded"""
+        assert position_calculator.ts is skyfield_ts
+
 
 # =============================================================================
 # Test Position Calculation
@@ -125,59 +112,80 @@ class TestPositionCalculatorInitialization:
 class TestGetPosition:
     """Tests for get_position method"""
 
-    def test_get_position_returns_position_data(self, position_calculator, sample_timestamp):
+    def test_get_position_returns_position_data(self, iss_position):
         """Test that get_position returns PositionData"""
-        pos = position_calculator.get_position("ISS", sample_timestamp)
-        assert pos is not None
-        assert isinstance(pos, PositionData)
+        assert iss_position is not None
+        assert isinstance(iss_position, PositionData)
 
-    def test_get_position_lat_lon_ranges(self, position_calculator, sample_timestamp):
+    def test_get_position_lat_lon_ranges(self, iss_position):
         """Test that latitude and longitude are in valid ranges"""
-        pos = position_calculator.get_position("ISS", sample_timestamp)
-        assert -90 <= pos.latitude <= 90
-        assert -180 <= pos.longitude <= 180
+        assert -90 <= iss_position.latitude <= 90
+        assert -180 <= iss_position.longitude <= 180
 
-    def test_get_position_altitude_positive(self, position_calculator, sample_timestamp):
+    def test_get_position_altitude_positive(self, iss_position):
         """Test that altitude is positive for LEO satellites"""
-        pos = position_calculator.get_position("ISS", sample_timestamp)
-        assert pos.altitude_km > 0
+        assert iss_position.altitude_km > 0
         # LEO altitude range: ~300-2000 km
-        assert 300 < pos.altitude_km < 2000
+        assert 300 < iss_position.altitude_km < 2000
 
-    def test_get_position_velocity_reasonable(self, position_calculator, sample_timestamp):
+    def test_get_position_velocity_reasonable(self, iss_position):
         """Test that velocity is in orbital range (~27,000 km/h for LEO)"""
-        pos = position_calculator.get_position("ISS", sample_timestamp)
         # Orbital velocity should be approximately 25,000-30,000 km/h
-        assert 25000 < pos.velocity_kmph < 30000
+        assert 25000 < iss_position.velocity_kmph < 30000
 
-    def test_get_position_case_insensitive(self, position_calculator, sample_timestamp):
+    @pytest.mark.parametrize("name", ["ISS", "iss", "IsS"])
+    def test_get_position_case_insensitive(self, position_calculator, name):
         """Test case-insensitive satellite name matching"""
-        pos1 = position_calculator.get_position("ISS", sample_timestamp)
-        pos2 = position_calculator.get_position("iss", sample_timestamp)
-        pos3 = position_calculator.get_position("IsS", sample_timestamp)
-
-        # All should return valid positions
-        assert pos1 is not None
-        assert pos2 is not None
-        assert pos3 is not None
+        # Name resolution is pure lookup; no need to propagate to check it
+        iss = position_calculator.satellites["ISS"]
+        assert position_calculator._find_satellite(name) is iss
+        assert position_calculator.satellite_indices([name]).tolist() == [
+            position_calculator._element_rows["ISS"]
+        ]
 
     def test_get_position_partial_match(self, position_calculator, sample_timestamp):
         """Test partial satellite name matching"""
         pos = position_calculator.get_position("NOAA", sample_timestamp)
         assert pos is not None
 
+    def test_partial_match_resolved_once(self, position_calculator):
+        """Test that a partial name is matched by one scan, then from the memo"""
+        noaa = position_calculator.satellites["NOAA-18"]
+        assert position_calculator._find_satellite("noaa") is noaa
+
+        # Any casing of the same partial name is served from the memo
+        key = (id(position_calculator._satellites_by_upper), "NOAA")
+        assert position_calculator._partial_matches[key] is noaa
+        assert position_calculator._find_satellite("Noaa") is noaa
+
+    def test_partial_match_memo_is_bounded(self, sample_tle_data, skyfield_ts, monkeypatch):
+        """Test that looking up many unknown names does not grow the memo without limit"""
+        # Own calculator, so the shared fixture's memo is left alone
+        calc = PositionCalculator(sample_tle_data, ts=skyfield_ts)
+        monkeypatch.setattr(position_calc_module, "PARTIAL_MATCH_MEMO_SIZE", 4)
+        for i in range(10):
+            assert calc._find_satellite(f"UNKNOWN-{i}") is None
+            assert len(calc._partial_matches) <= 4
+
     def test_get_position_unknown_satellite(self, position_calculator, sample_timestamp):
         """Test with unknown satellite name"""
         pos = position_calculator.get_position("UNKNOWN-SAT", sample_timestamp)
         assert pos is None
 
-    def test_get_position_different_satellites(self, position_calculator, sample_timestamp):
+    def test_get_position_returns_none_on_error(self, position_calculator, sample_timestamp):
+        """Test that propagation errors are reported as None instead of raised"""
+        iss = position_calculator._find_satellite("ISS")
+        with patch.object(iss, "at", side_effect=ValueError("propagation failed")):
+            assert position_calculator.get_position("ISS", sample_timestamp) is None
+
+    def test_get_position_different_satellites(self, position_calculator, sample_timestamp,
+                                               iss_position):
         """Test that different satellites return different positions"""
-        pos_iss = position_calculator.get_position("ISS", sample_timestamp)
         pos_noaa = position_calculator.get_position("NOAA-18", sample_timestamp)
 
         # Positions should be different (same time, different orbits)
-        assert pos_iss.latitude != pos_noaa.latitude or pos_iss.longitude != pos_noaa.longitude
+        assert (iss_position.latitude != pos_noaa.latitude
+                or iss_position.longitude != pos_noaa.longitude)
 
     def test_get_position_naive_timestamp(self, position_calculator):
         """Test with naive datetime (no timezone)"""
@@ -189,7 +197,6 @@ class TestGetPosition:
     def test_get_position_non_utc_timezone(self, position_calculator):
         """Test with non-UTC timezone"""
         # Create timezone that's UTC+8
-        from datetime import timezone, timedelta
         utc_plus_8 = timezone(timedelta(hours=8))
         local_time = datetime(2024, 2, 10, 15, 30, 0, tzinfo=utc_plus_8)
 
@@ -210,6 +217,110 @@ class TestGetPosition:
         assert pos1.latitude != pos2.latitude or pos1.longitude != pos2.longitude
 
 
+# =============================================================================
+# Test Batch Position Calculation
+# =============================================================================
+
+
+class TestGetPositionsBatch:
+    """Tests for get_positions_batch method"""
+
+    def test_batch_shape(self, position_calculator):
+        """Test that batch results have one row per satellite, one column per time"""
+        start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
+        times = [start + timedelta(minutes=i) for i in range(5)]
+        result = position_calculator.get_positions_batch(["ISS", "NOAA-18"], times)
+
+        assert set(result) == {"latitude", "longitude", "altitude_km", "velocity_kmph"}
+        for values in result.values():
+            assert values.shape == (2, 5)
+            assert values.dtype == np.float32
+
+    def test_batch_matches_single_position(self, position_calculator, sample_timestamp):
+        """Test that batch results match get_position for each satellite"""
+        names = ["ISS", "NOAA-18", "STARLINK-1001"]
+        result = position_calculator.get_positions_batch(names, [sample_timestamp])
+
+        for row, name in enumerate(names):
+            pos = position_calculator.get_position(name, sample_timestamp)
+            assert result["latitude"][row, 0] == pytest.approx(pos.latitude)
+            assert result["longitude"][row, 0] == pytest.approx(pos.longitude)
+            assert result["altitude_km"][row, 0] == pytest.approx(pos.altitude_km)
+            assert result["velocity_kmph"][row, 0] == pytest.approx(pos.velocity_kmph)
+
+    def test_batch_repeated_satellite(self, position_calculator, sample_timestamp):
+        """Test that repeated names get identical positions"""
+        result = position_calculator.get_positions_batch(["ISS", "iss"], [sample_timestamp])
+        assert result["latitude"][0, 0] == result["latitude"][1, 0]
+        assert result["longitude"][0, 0] == result["longitude"][1, 0]
+
+    def test_batch_unknown_satellite(self, position_calculator, sample_timestamp):
+        """Test that unknown satellites yield NaN rows"""
+        result = position_calculator.get_positions_batch(
+            ["UNKNOWN-SAT", "ISS"], [sample_timestamp]
+        )
+        assert np.isnan(result["latitude"][0, 0])
+        assert not np.isnan(result["latitude"][1, 0])
+
+    def test_batch_reuses_satrec_array(self, position_calculator, sample_timestamp):
+        """Test that the propagator is built once for an unchanged satellite set"""
+        position_calculator.get_positions_batch(["ISS", "NOAA-18"], [sample_timestamp])
+        first = position_calculator._satrec_array_value
+        position_calculator.get_positions_batch(["ISS", "NOAA-18"], [sample_timestamp])
+        assert position_calculator._satrec_array_value is first
+
+        position_calculator.get_positions_batch(["ISS"], [sample_timestamp])
+        assert position_calculator._satrec_array_value is not first
+
+    def test_satellite_indices(self, position_calculator):
+        """Test that names map to element rows, case-insensitively, with -1 for unknowns"""
+        rows = position_calculator.satellite_indices(["ISS", "iss", "UNKNOWN-SAT"])
+        assert rows.tolist()[:2] == [0, 0]
+        assert rows[2] == -1
+        assert position_calculator.elements[rows[0], ELEMENT_FIELDS.index("satnum")] == 25544
+
+
+class TestGetPositionsAt:
+    """Tests for positions at a shared, pre-built Skyfield time"""
+
+    def test_position_at_matches_get_position(self, position_calculator, sample_timestamp,
+                                              iss_position):
+        """Test that a pre-built time gives the same result as get_position"""
+        t = position_calculator.time_at(sample_timestamp)
+        pos_at = position_calculator.get_position_at("ISS", t)
+
+        assert pos_at.latitude == pytest.approx(iss_position.latitude)
+        assert pos_at.longitude == pytest.approx(iss_position.longitude)
+        assert pos_at.altitude_km == pytest.approx(iss_position.altitude_km)
+
+    def test_time_at_unix_timestamp_matches_datetime(self, position_calculator, sample_timestamp):
+        """Test that the Unix timestamp fast path gives the same time as a datetime"""
+        from_datetime = position_calculator.time_at(sample_timestamp)
+        from_unix = position_calculator.time_at(sample_timestamp.timestamp())
+        assert (from_unix.tt - from_datetime.tt) * 86400 == pytest.approx(0, abs=1e-4)
+
+    def test_positions_at_shares_time(self, position_calculator, sample_timestamp):
+        """Test that several satellites can be evaluated at one time"""
+        t = position_calculator.time_at(sample_timestamp)
+        positions = position_calculator.get_positions_at(["ISS", "UNKNOWN-SAT", "NOAA-18"], t)
+
+        assert len(positions) == 3
+        assert isinstance(positions[0], PositionData)
+        assert positions[1] is None
+        assert isinstance(positions[2], PositionData)
+
+    def test_positions_at_matches_position_at(self, position_calculator, sample_timestamp):
+        """Test that the vectorized path matches per-satellite results"""
+        t = position_calculator.time_at(sample_timestamp)
+        names = ["ISS", "NOAA-18", "STARLINK-1001", "ISS"]
+        for name, pos in zip(names, position_calculator.get_positions_at(names, t)):
+            expected = position_calculator.get_position_at(name, t)
+            assert pos.latitude == pytest.approx(expected.latitude)
+            assert pos.longitude == pytest.approx(expected.longitude)
+            assert pos.altitude_km == pytest.approx(expected.altitude_km)
+            assert pos.velocity_kmph == pytest.approx(expected.velocity_kmph)
+
+
 # =============================================================================
 # Test Velocity Calculation
 # =============================================================================
@@ -316,52 +427,47 @@ class TestUtilityMethods:
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def iss_day(position_calculator):
+    """ISS positions every hour for 24 hours, propagated in one batch call"""
+    start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
+    times = [start + timedelta(hours=i) for i in range(24)]
+    result = position_calculator.get_positions_batch(["ISS"], times)
+    return {field: values[0] for field, values in result.items()}
+
+
+@pytest.mark.slow
 class TestPositionValueRanges:
     """Tests for position value ranges over time"""
 
-    def test_latitude_stays_in_range(self, position_calculator):
+    def test_latitude_stays_in_range(self, iss_day):
         """Test that latitude stays within valid range over multiple time points"""
-        start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
-        for i in range(24):  # Check every hour for 24 hours
-            t = start + timedelta(hours=i)
-            pos = position_calculator.get_position("ISS", t)
-            assert -90 <= pos.latitude <= 90, \
-                f"Latitude {pos.latitude} out of range at hour {i}"
+        latitude = iss_day["latitude"]
+        assert np.all((-90 <= latitude) & (latitude <= 90)), \
+            f"Latitude out of range at hours {np.flatnonzero(np.abs(latitude) > 90)}"
 
-    def test_longitude_normalization(self, position_calculator):
+    def test_longitude_normalization(self, iss_day):
         """Test that longitude is normalized to -180 to 180 range"""
-        start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
-        for i in range(24):
-            t = start + timedelta(hours=i)
-            pos = position_calculator.get_position("ISS", t)
-            assert -180 <= pos.longitude <= 180, \
-                f"Longitude {pos.longitude} out of range at hour {i}"
+        longitude = iss_day["longitude"]
+        assert np.all((-180 <= longitude) & (longitude <= 180)), \
+            f"Longitude out of range at hours {np.flatnonzero(np.abs(longitude) > 180)}"
 
-    def test_altitude_stays_positive(self, position_calculator):
+    def test_altitude_stays_positive(self, iss_day):
         """Test that altitude stays positive"""
-        start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
-        for i in range(24):
-            t = start + timedelta(hours=i)
-            pos = position_calculator.get_position("ISS", t)
-            assert pos.altitude_km > 0, \
-                f"Altitude {pos.altitude_km} is not positive at hour {i}"
+        altitude = iss_day["altitude_km"]
+        assert np.all(altitude > 0), \
+            f"Altitude not positive at hours {np.flatnonzero(altitude <= 0)}"
 
-    def test_velocity_stays_consistent(self, position_calculator):
+    def test_velocity_stays_consistent(self, iss_day):
         """Test that velocity stays consistent (orbital mechanics)"""
-        start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
-        velocities = []
-        for i in range(24):
-            t = start + timedelta(hours=i)
-            pos = position_calculator.get_position("ISS", t)
-            velocities.append(pos.velocity_kmph)
+        velocities = iss_day["velocity_kmph"]
 
         # All velocities should be in orbital range
-        for v in velocities:
-            assert 25000 < v < 30000, \
-                f"Velocity {v} out of orbital range"
+        assert np.all((25000 < velocities) & (velocities < 30000)), \
+            f"Velocities out of orbital range: {velocities}"
 
         # Velocity shouldn't vary much for circular LEO orbit
-        velocity_variation = max(velocities) - min(velocities)
+        velocity_variation = velocities.max() - velocities.min()
         assert velocity_variation < 5000, \
             f"Velocity varies too much: {velocity_variation}"
 
@@ -374,29 +480,19 @@ class TestPositionValueRanges:
 class TestDifferentSatellites:
     """Tests with different satellite types"""
 
-    def test_iss_position_calculation(self, position_calculator, sample_timestamp):
-        """Test ISS position calculation"""
-        pos = position_calculator.get_position("ISS", sample_timestamp)
+    @pytest.mark.parametrize("name, min_altitude_km, max_altitude_km", [
+        ("ISS", 350, 500),            # ISS altitude is approximately 408 km
+        ("NOAA-18", 700, 1000),       # NOAA satellites are in polar orbits (~850 km)
+        ("STARLINK-1001", 400, 700),  # Starlink satellites are in lower LEO (~550 km)
+    ])
+    def test_altitude_band(self, position_calculator, sample_timestamp,
+                           name, min_altitude_km, max_altitude_km):
+        """Test that each satellite type sits in its expected altitude band"""
+        pos = position_calculator.get_position(name, sample_timestamp)
         assert pos is not None
-        # ISS altitude is approximately 408 km
-        assert 350 < pos.altitude_km < 500
-        # ISS inclination is 51.6 degrees, so it covers most of Earth
+        assert min_altitude_km < pos.altitude_km < max_altitude_km
         assert -90 <= pos.latitude <= 90
 
-    def test_noaa_position_calculation(self, position_calculator, sample_timestamp):
-        """Test NOAA satellite position calculation"""
-        pos = position_calculator.get_position("NOAA-18", sample_timestamp)
-        assert pos is not None
-        # NOAA satellites are in polar orbits (~850 km)
-        assert 700 < pos.altitude_km < 1000
-
-    def test_starlink_position_calculation(self, position_calculator, sample_timestamp):
-        """Test Starlink satellite position calculation"""
-        pos = position_calculator.get_position("STARLINK-1001", sample_timestamp)
-        assert pos is not None
-        # Starlink satellites are in lower LEO (~550 km)
-        assert 400 < pos.altitude_km < 700
-
 
 # =============================================================================
 # Integration Tests
@@ -406,37 +502,42 @@ class TestDifferentSatellites:
 class TestIntegration:
     """Integration tests for position calculation"""
 
+    @pytest.mark.slow
     def test_position_tracking_over_orbit(self, position_calculator):
         """Test tracking satellite position over one orbit"""
         # ISS completes an orbit in ~90 minutes
         start = datetime(2024, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
-        positions = []
+        times = [start + timedelta(minutes=i) for i in range(0, 100, 5)]  # Every 5 minutes
 
-        for i in range(0, 100, 5):  # Every 5 minutes for 100 minutes
-            t = start + timedelta(minutes=i)
-            pos = position_calculator.get_position("ISS", t)
-            positions.append(pos)
+        # One propagation over an array of times
+        result = position_calculator.get_positions_batch(["ISS"], times)
+        latitudes, longitudes = result["latitude"][0], result["longitude"][0]
 
         # Should have collected multiple positions
-        assert len(positions) > 15
+        assert not np.isnan(latitudes).any()
+        assert len(latitudes) > 15
 
         # Verify satellite moved (positions are different)
-        unique_positions = set((p.latitude, p.longitude) for p in positions)
-        assert len(unique_positions) > len(positions) / 2, \
+        # Rounded to ~0.1 m so float noise can't count as movement
+        track = np.column_stack([latitudes.round(6), longitudes.round(6)])
+        unique_positions = np.unique(track, axis=0)
+        assert len(unique_positions) > len(latitudes) / 2, \
             "Satellite should have moved significantly"
 
-    def test_position_data_consistency(self, position_calculator, sample_timestamp):
+    def test_position_data_consistency(self, iss_position):
         """Test that position data is internally consistent"""
-        pos = position_calculator.get_position("ISS", sample_timestamp)
-
         # Altitude should be positive and realistic
-        assert pos.altitude_km > 0
-        assert pos.altitude_km < 10000
+        assert iss_position.altitude_km > 0
+        assert iss_position.altitude_km < 10000
 
         # Velocity should be consistent with altitude (lower = faster)
         # For circular orbit: v = sqrt(GM/r)
         # At 400km: ~27600 km/h
-        assert 25000 < pos.velocity_kmph < 30000
+        assert 25000 < iss_position.velocity_kmph < 30000
+
+
+class TestCreatePositionManager:
+    """Tests for the create_position_manager factory (TLEManager is mocked)"""
 
     @patch('generators.position_calc.TLEManager')
     def test_create_position_manager(self, mock_tle_manager_class):
@@ -1,13 +1,21 @@
 """
 Tests for the satellite simulator module
 """
-from unittest.mock import AsyncMock, Mock
+import asyncio
+import json
+import re
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from config import SimulatorConfig
 from generators.telemetry_gen import TelemetryGenerator
-from satellite_sim import Satellite, SatelliteSwarm
+from satellite_sim import IsoClock, Satellite, SatelliteSwarm
+
+# Satellite IDs are SAT- followed by 4 digits
+SAT_ID_RE = re.compile(r"SAT-\d{4}")
 
 
 class TestSatellite:
@@ -23,8 +31,8 @@ class TestSatellite:
         assert satellite.id == "SAT-0001"
         assert satellite.generator == generator
 
-    @pytest.mark.asyncio
-    async def test_send_telemetry_creates_correct_payload(self):
+    async def test_send_telemetry_creates_correct_payload(self, mock_aiohttp_session,
+                                                          simulator_config):
         """Test that send_telemetry creates the correct payload structure"""
         generator = TelemetryGenerator(
             base_battery=85.5,
@@ -33,113 +41,144 @@ class TestSatellite:
             anomaly_rate=0.0
         )
         satellite = Satellite(id="SAT-0001", generator=generator)
+        mock_session, _ = mock_aiohttp_session
 
-        # Create a mock response that works as an async context manager
-        mock_response = Mock()
-        mock_response.status = 202
-        mock_response.json = AsyncMock(return_value={"status": "accepted"})
-
-        # Create an async context manager mock
-        class AsyncContextManagerMock:
-            async def __aenter__(self):
-                return mock_response
-            async def __aexit__(self, *args):
-                pass
-
-        # Mock the session.post to return the context manager
-        mock_session = Mock()
-        mock_session.post = Mock(return_value=AsyncContextManagerMock())
-
-        config = SimulatorConfig(
-            num_satellites=1,
-            points_per_second_per_satellite=1,
-            api_url="http://localhost:8080",
-            duration_seconds=1,
-            max_connections=10,
-            max_connections_per_host=5,
-            anomaly_rate=0.01
-        )
-        result = await satellite.send_telemetry(mock_session, config)
+        result = await satellite.send_telemetry(mock_session, simulator_config)
 
         assert result["status"] == "success"
         assert result["satellite"] == "SAT-0001"
 
+        # Body is sent as pre-serialized JSON bytes
+        kwargs = mock_session.post.call_args.kwargs
+        body = json.loads(kwargs["data"])
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert body["satellite_id"] == "SAT-0001"
+        assert datetime.fromisoformat(body["timestamp"]).tzinfo is not None
+
+    def test_build_payload_is_valid_json(self):
+        """Test that the hand-assembled payload bytes decode to the expected fields"""
+        satellite = Satellite(id='SAT-"1"', generator=TelemetryGenerator(anomaly_rate=0.0))
+        payload = json.loads(satellite.build_payload())
+
+        assert payload["satellite_id"] == 'SAT-"1"'
+        assert datetime.fromisoformat(payload["timestamp"]).tzinfo is not None
+        assert isinstance(payload["battery_charge_percent"], float)
+        assert isinstance(payload["storage_usage_mb"], float)
+        assert isinstance(payload["signal_strength_dbm"], float)
+        assert "latitude" not in payload
+
+    def test_build_payload_includes_position(self, mock_position_calculator):
+        """Test that position fields are appended when the generator provides them"""
+        generator = TelemetryGenerator(
+            satellite_name="ISS",
+            position_calculator=mock_position_calculator
+        )
+        payload = json.loads(Satellite(id="SAT-0001", generator=generator).build_payload())
+
+        assert payload["latitude"] == 40.7128
+        assert payload["longitude"] == -74.006
+        assert payload["altitude_km"] == 408.5
+        assert payload["velocity_kmph"] == 27576.5
+
     def test_satellite_id_format(self):
         """Test that satellite IDs follow the expected format"""
         generator = TelemetryGenerator()
         satellite = Satellite(id="SAT-1234", generator=generator)
-        assert satellite.id.startswith("SAT-")
-        assert satellite.id[4:].isdigit()
+        assert SAT_ID_RE.fullmatch(satellite.id)
+
+
+class TestIsoClock:
+    """Tests for the shared millisecond timestamp clock"""
+
+    def test_now_is_iso_utc(self):
+        """Test that the clock returns a timezone-aware ISO 8601 timestamp"""
+        parsed = datetime.fromisoformat(IsoClock().now())
+        assert parsed.utcoffset().total_seconds() == 0
 
+    def test_now_formats_once_per_millisecond(self):
+        """Test that the string is reused within a millisecond and refreshed after"""
+        clock = IsoClock()
+        with patch("satellite_sim.time.time_ns",
+                   side_effect=[1_700_000_000_123_400_000, 1_700_000_000_123_900_000,
+                                1_700_000_000_124_000_000]):
+            first = clock.now()
+            assert clock.now() is first
+            assert clock.now() != first
+
+        assert first == "2023-11-14T22:13:20.123+00:00"
 
 class TestSatelliteSwarm:
     """Tests for the SatelliteSwarm class"""
 
-    def test_satellite_swarm_initialization(self, simulator_config, mock_tle_and_position):
+    def test_satellite_swarm_initialization(self, built_swarm):
         """Test that SatelliteSwarm initializes correctly"""
-        swarm = SatelliteSwarm(simulator_config)
-        assert len(swarm.satellites) == simulator_config.num_satellites
-        assert swarm.stats["total_sent"] == 0
-        assert swarm.stats["success"] == 0
-        assert swarm.stats["errors"] == 0
+        assert len(built_swarm.satellites) == built_swarm.config.num_satellites
+        assert built_swarm.stats["total_sent"] == 0
+        assert built_swarm.stats["success"] == 0
+        assert built_swarm.stats["errors"] == 0
 
-    def test_correct_satellite_count(self, mock_tle_and_position):
+    def test_correct_satellite_count(self, shared_swarm):
         """Test that the correct number of satellites are created"""
-        config = SimulatorConfig(
-            num_satellites=50,
-            points_per_second_per_satellite=10,
-            api_url="http://localhost:8080",
-            duration_seconds=1,
-            max_connections=100,
-            max_connections_per_host=50,
-            anomaly_rate=0.01
-        )
-        swarm = SatelliteSwarm(config)
+        swarm = shared_swarm(num_satellites=50)
         assert len(swarm.satellites) == 50
 
-    def test_satellite_ids_format(self, simulator_config, mock_tle_and_position):
+    def test_satellite_ids_format(self, built_swarm):
         """Test that all satellite IDs follow the SAT-XXXX format"""
-        swarm = SatelliteSwarm(simulator_config)
-        for satellite in swarm.satellites:
-            assert satellite.id.startswith("SAT-")
-            # ID should be SAT- followed by 4 digits
-            assert len(satellite.id) == 8
-            assert satellite.id[4:].isdigit()
+        bad_ids = [sat.id for sat in built_swarm.satellites if not SAT_ID_RE.fullmatch(sat.id)]
+        assert bad_ids == []
+
+    def test_satellite_ids_are_interned(self, built_swarm):
+        """Test that satellite IDs are interned strings"""
+        for satellite in built_swarm.satellites:
+            assert satellite.id is sys.intern(satellite.id)
 
-    def test_stats_initialization(self, simulator_config, mock_tle_and_position):
+    def test_stats_initialization(self, built_swarm):
         """Test that statistics are properly initialized"""
-        swarm = SatelliteSwarm(simulator_config)
-        assert "total_sent" in swarm.stats
-        assert "success" in swarm.stats
-        assert "errors" in swarm.stats
-        assert "start_time" in swarm.stats
-        assert isinstance(swarm.stats["start_time"], float)
-
-    def test_each_satellite_has_unique_generator(self, simulator_config, mock_tle_and_position):
-        """Test that each satellite has its own generator instance"""
-        swarm = SatelliteSwarm(simulator_config)
-        generators = [sat.generator for sat in swarm.satellites]
+        assert {"total_sent", "success", "errors", "start_time"} <= built_swarm.stats.keys()
+        assert isinstance(built_swarm.stats["start_time"], float)
+
+    def test_fleet_covers_every_satellite(self, built_swarm):
+        """Test that one fleet generates readings for all satellites"""
+        assert built_swarm.fleet.num_satellites == len(built_swarm.satellites)
+        assert all(sat.generator is None for sat in built_swarm.satellites)
 
-        # All generators should be unique instances
-        # (even if they have the same config)
-        assert len(set(id(g) for g in generators)) == len(generators)
+    def test_fleet_has_correct_anomaly_rate(self, built_swarm):
+        """Test that the fleet inherits the anomaly rate from config"""
+        assert built_swarm.fleet.anomaly_rate == built_swarm.config.anomaly_rate
 
-    def test_generators_have_correct_anomaly_rate(self, simulator_config, mock_tle_and_position):
-        """Test that generators inherit the anomaly rate from config"""
+    def test_tick_payloads_one_per_satellite(self, simulator_config, mock_tle_and_position):
+        """Test that a tick yields one payload per satellite, positions for tracked ones"""
         swarm = SatelliteSwarm(simulator_config)
-        for satellite in swarm.satellites:
-            assert satellite.generator.anomaly_rate == simulator_config.anomaly_rate
+        payloads = [json.loads(payload) for payload in swarm.tick_payloads()]
+
+        assert [p["satellite_id"] for p in payloads] == [sat.id for sat in swarm.satellites]
+        assert len({p["timestamp"] for p in payloads}) == 1
+        tracked = len(swarm.orbit_names)
+        assert all(p["latitude"] == 40.7128 for p in payloads[:tracked])
+        assert all("latitude" not in p for p in payloads[tracked:])
+
+    def test_tick_payloads_propagates_once_per_second(self, simulator_config,
+                                                      mock_tle_and_position):
+        """Test that all satellites are propagated in one call, reused within a second"""
+        _, mock_calc = mock_tle_and_position
+        swarm = SatelliteSwarm(simulator_config)
+
+        with patch("satellite_sim.time.time", side_effect=[1000.1, 1000.9, 1001.0]):
+            for _ in range(3):
+                swarm.tick_payloads()
 
+        assert mock_calc.get_positions_at.call_count == 2
+        names, t = mock_calc.get_positions_at.call_args.args
+        assert names == swarm.orbit_names
+        assert t is mock_calc.time_at.return_value
 
 class TestSatelliteSwarmStatistics:
     """Tests for statistics tracking"""
 
-    def test_stats_start_at_zero(self, simulator_config, mock_tle_and_position):
+    def test_stats_start_at_zero(self, built_swarm):
         """Test that all statistics start at zero"""
-        swarm = SatelliteSwarm(simulator_config)
-        assert swarm.stats["total_sent"] == 0
-        assert swarm.stats["success"] == 0
-        assert swarm.stats["errors"] == 0
+        counters = {key: built_swarm.stats[key] for key in ("total_sent", "success", "errors")}
+        assert counters == {"total_sent": 0, "success": 0, "errors": 0}
 
     def test_stats_can_be_updated(self, simulator_config, mock_tle_and_position):
         """Test that statistics can be updated"""
@@ -152,79 +191,171 @@ class TestSatelliteSwarmStatistics:
         assert swarm.stats["success"] == 95
         assert swarm.stats["errors"] == 5
 
+    def test_flush_stats_folds_satellite_counters(self, simulator_config, mock_tle_and_position):
+        """Test that flush_stats sums per-satellite counters into stats and resets them"""
+        swarm = SatelliteSwarm(simulator_config)
+        for sat in swarm.satellites:
+            sat._local_sent, sat._local_ok, sat._local_err = 3, 2, 1
+
+        swarm.flush_stats()
+        swarm.flush_stats()
+
+        count = len(swarm.satellites)
+        assert swarm.stats["total_sent"] == 3 * count
+        assert swarm.stats["success"] == 2 * count
+        assert swarm.stats["errors"] == count
+
 
 class TestEdgeCases:
     """Tests for edge cases"""
 
-    def test_single_satellite(self, mock_tle_and_position):
-        """Test with just one satellite"""
-        config = SimulatorConfig(
-            num_satellites=1,
-            points_per_second_per_satellite=10,
-            api_url="http://localhost:8080",
-            duration_seconds=1,
-            max_connections=10,
-            max_connections_per_host=5,
-            anomaly_rate=0.01
+    @pytest.mark.parametrize("num_satellites,anomaly_rate,duration", [
+        pytest.param(1, 0.01, 1, id="single-satellite"),
+        pytest.param(1000, 0.01, 1, id="large-satellite-count"),
+        pytest.param(10, 0.0, 1, id="zero-anomaly-rate"),
+        pytest.param(10, 1.0, 1, id="high-anomaly-rate"),
+        pytest.param(10, 0.01, 0, id="infinite-duration"),
+    ])
+    def test_swarm_edge_case(self, shared_swarm, num_satellites, anomaly_rate, duration):
+        """Test that edge-case configs build a complete, correctly configured swarm"""
+        swarm = shared_swarm(
+            num_satellites=num_satellites,
+            anomaly_rate=anomaly_rate,
+            duration_seconds=duration,
         )
-        swarm = SatelliteSwarm(config)
-        assert len(swarm.satellites) == 1
+
+        assert len(swarm.satellites) == num_satellites
         assert swarm.satellites[0].id == "SAT-0001"
+        assert swarm.config.duration_seconds == duration
+        assert swarm.fleet.anomaly_rate == anomaly_rate
 
-    def test_large_satellite_count(self, mock_tle_and_position):
-        """Test with a large number of satellites"""
-        config = SimulatorConfig(
-            num_satellites=1000,
-            points_per_second_per_satellite=1,
-            api_url="http://localhost:8080",
-            duration_seconds=1,
-            max_connections=1000,
-            max_connections_per_host=500,
-            anomaly_rate=0.01
-        )
-        swarm = SatelliteSwarm(config)
-        assert len(swarm.satellites) == 1000
-
-    def test_zero_anomaly_rate(self, mock_tle_and_position):
-        """Test with zero anomaly rate"""
-        config = SimulatorConfig(
-            num_satellites=10,
-            points_per_second_per_satellite=10,
-            api_url="http://localhost:8080",
-            duration_seconds=1,
-            max_connections=10,
-            max_connections_per_host=5,
-            anomaly_rate=0.0
-        )
-        swarm = SatelliteSwarm(config)
-        for satellite in swarm.satellites:
-            assert satellite.generator.anomaly_rate == 0.0
-
-    def test_high_anomaly_rate(self, mock_tle_and_position):
-        """Test with 100% anomaly rate"""
-        config = SimulatorConfig(
-            num_satellites=10,
-            points_per_second_per_satellite=10,
-            api_url="http://localhost:8080",
-            duration_seconds=1,
-            max_connections=10,
-            max_connections_per_host=5,
-            anomaly_rate=1.0
-        )
-        swarm = SatelliteSwarm(config)
-        for satellite in swarm.satellites:
-            assert satellite.generator.anomaly_rate == 1.0
-
-    def test_infinite_duration(self, mock_tle_and_position):
-        """Test with zero duration (infinite run)"""
-        config = SimulatorConfig(
-            num_satellites=10,
-            points_per_second_per_satellite=10,
-            api_url="http://localhost:8080",
-            duration_seconds=0,
-            max_connections=10,
-            max_connections_per_host=5,
-            anomaly_rate=0.01
-        )
-        swarm = SatelliteSwarm(config)
-        assert swarm.config.duration_seconds == 0
+
+class TestBatchSending:
+    """Tests for batched telemetry sending"""
+
+    @staticmethod
+    def _mock_session(status=202, body=None):
+        """Mock aiohttp session whose post() records the request body"""
+        response = Mock()
+        response.status = status
+        response.json = AsyncMock(return_value=body or {})
+
+        # MagicMock supports "async with"; __aenter__ is an AsyncMock
+        session = Mock()
+        session.post = MagicMock()
+        session.post.return_value.__aenter__.return_value = response
+        return session
+
+    async def test_scheduler_queues_one_point_per_satellite(self, simulator_config,
+                                                            mock_tle_and_position):
+        """Test that each scheduler tick queues one payload per satellite"""
+        swarm = SatelliteSwarm(simulator_config)
+        queue = asyncio.Queue()
+
+        task = asyncio.create_task(swarm.run_scheduler(None, queue))
+        await asyncio.sleep(0)
+        simulator_config.stop.set()
+        await asyncio.wait_for(task, timeout=1)
+
+        ids = [json.loads(queue.get_nowait())["satellite_id"] for _ in range(queue.qsize())]
+        assert ids == [sat.id for sat in swarm.satellites]
+
+    async def test_scheduler_sends_individually_without_queue(self, simulator_config,
+                                                              mock_tle_and_position):
+        """Test that without a queue every satellite POSTs its point and stats add up"""
+        swarm = SatelliteSwarm(simulator_config)
+        session = self._mock_session()
+
+        task = asyncio.create_task(swarm.run_scheduler(session, None))
+        await asyncio.sleep(0)
+        simulator_config.stop.set()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert session.post.call_count == len(swarm.satellites)
+        assert swarm.stats["total_sent"] == 0
+
+        swarm.flush_stats()
+        assert swarm.stats["total_sent"] == len(swarm.satellites)
+        assert swarm.stats["success"] == len(swarm.satellites)
+        assert swarm.stats["errors"] == 0
+
+    async def test_slow_send_only_delays_its_own_satellite(self, simulator_config,
+                                                           mock_tle_and_position):
+        """Test that a hung request does not hold back the other satellites' ticks"""
+        simulator_config.points_per_second_per_satellite = 100
+        swarm = SatelliteSwarm(simulator_config)
+        hung = asyncio.Event()
+        sends = {sat.id: 0 for sat in swarm.satellites}
+
+        async def send_telemetry(sat, session, config, payload=None):
+            sends[sat.id] += 1
+            if sat.id == "SAT-0001":
+                await hung.wait()
+
+        with patch.object(Satellite, "send_telemetry", send_telemetry):
+            task = asyncio.create_task(swarm.run_scheduler(None, None))
+            await asyncio.sleep(0.05)
+            simulator_config.stop.set()
+            hung.set()
+            await asyncio.wait_for(task, timeout=1)
+
+        assert sends.pop("SAT-0001") == 1
+        assert min(sends.values()) > 1
+
+    async def test_post_batch_sends_json_array(self, simulator_config, mock_tle_and_position):
+        """Test that a batch is POSTed as one JSON array to /telemetry/batch"""
+        swarm = SatelliteSwarm(simulator_config)
+        session = self._mock_session(body={"status": "accepted", "count": 3})
+        batch = swarm.tick_payloads()[:3]
+
+        await swarm.post_batch(session, "http://localhost:8080/telemetry/batch", batch)
+
+        args, kwargs = session.post.call_args
+        assert args[0] == "http://localhost:8080/telemetry/batch"
+        assert json.loads(kwargs["data"]) == [json.loads(point) for point in batch]
+        assert [point["satellite_id"] for point in json.loads(kwargs["data"])] == [
+            "SAT-0001", "SAT-0002", "SAT-0003"
+        ]
+        assert swarm.stats == {**swarm.stats, "total_sent": 3, "success": 3, "errors": 0}
+
+    async def test_post_batch_counts_rejected_points(self, simulator_config, mock_tle_and_position):
+        """Test that points the service did not accept are counted as errors"""
+        swarm = SatelliteSwarm(simulator_config)
+        batch = swarm.tick_payloads()[:4]
+
+        await swarm.post_batch(self._mock_session(body={"count": 3}), "url", batch)
+        await swarm.post_batch(self._mock_session(status=400), "url", batch)
+
+        assert swarm.stats["total_sent"] == 8
+        assert swarm.stats["success"] == 3
+        assert swarm.stats["errors"] == 5
+
+    async def test_post_batch_without_count_accepts_nothing(self, simulator_config,
+                                                             mock_tle_and_position):
+        """Test that a 202 whose body omits count records every point as an error"""
+        swarm = SatelliteSwarm(simulator_config)
+        batch = swarm.tick_payloads()[:4]
+
+        await swarm.post_batch(self._mock_session(body={}), "url", batch)
+
+        assert swarm.stats["total_sent"] == 4
+        assert swarm.stats["success"] == 0
+        assert swarm.stats["errors"] == 4
+
+    async def test_send_batches_coalesces_queued_points(self, simulator_config, mock_tle_and_position):
+        """Test that queued points are sent together, up to batch_size"""
+        simulator_config.batch_size = 4
+        simulator_config.batch_interval = 0.01
+        swarm = SatelliteSwarm(simulator_config)
+        session = self._mock_session()
+        queue = asyncio.Queue()
+        for i in range(6):
+            queue.put_nowait(json.dumps({"n": i}).encode())
+
+        task = asyncio.create_task(swarm.send_batches(session, queue))
+        while swarm.stats["total_sent"] < 6:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        sizes = [len(json.loads(call.kwargs["data"])) for call in session.post.call_args_list]
+        assert sizes == [4, 2]
@@ -3,15 +3,26 @@ Tests for the TLE Manager class
 
 Tests for downloading, caching, and accessing Two-Line Element (TLE) orbital data.
 """
-import json
-from datetime import datetime, timezone, timedelta
+import dataclasses
+import zlib
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 import requests
 
-from generators.tle_manager import TLEManager, TLEData, REAL_SATELLITES
+from generators import tle_manager as tle_manager_module
+from generators.tle_manager import (
+    CACHE_HEADER,
+    CACHE_MAGIC,
+    CODEC_RAW,
+    CODEC_ZSTD,
+    DOWNLOAD_RETRY,
+    DOWNLOAD_TIMEOUT,
+    REAL_SATELLITES,
+    TLEData,
+    TLEManager,
+)
 
 
 # =============================================================================
@@ -20,25 +31,9 @@ from generators.tle_manager import TLEManager, TLEData, REAL_SATELLITES
 
 
 @pytest.fixture
-def sample_tle_data():
-    """Sample TLE data for testing"""
-    return {
-        "ISS": TLEData(
-            "ISS",
-            "1 25544U 98067A   24010.50000000  .00010000  00000-0  18000-3 0  9998",
-            "2 25544  51.6416 250.0000 0005000 200.0000 150.0000 15.50000000420000"
-        ),
-        "NOAA-18": TLEData(
-            "NOAA-18",
-            "1 28654U 05018A   24010.50000000  .00000000  00000-0  00000-0 0  9998",
-            "2 28654  99.1000 200.0000 0014000 100.0000 260.0000 14.10000000450000"
-        ),
-        "STARLINK-1001": TLEData(
-            "STARLINK-1001",
-            "1 44713U 19062A   24010.50000000  .00000000  00000-0  00000-0 0  9998",
-            "2 44713  53.0000 100.0000 0001000 100.0000 260.0000 15.00000000500000"
-        ),
-    }
+def sample_tle_data(sample_tle_data):
+    """Mutable copy of the shared sample TLE data"""
+    return dict(sample_tle_data)
 
 
 @pytest.fixture
@@ -67,6 +62,25 @@ def tle_manager(temp_cache_dir):
     return TLEManager(cache_dir=temp_cache_dir, cache_expiry_hours=24)
 
 
+def age_cache(manager, hours):
+    """Rewrite the cache header so the cache looks hours older"""
+    with open(manager.cache_file, 'r+b') as f:
+        fields = list(CACHE_HEADER.unpack(f.read(CACHE_HEADER.size)))
+        fields[3] -= hours * 3600
+        f.seek(0)
+        f.write(CACHE_HEADER.pack(*fields))
+
+
+def celestrak_response(text="", status_code=200, headers=None):
+    """A real requests.Response with the given body, as returned by requests.get"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.encoding = "utf-8"
+    response._content = text.encode()
+    return response
+
+
 # =============================================================================
 # Test TLEData
 # =============================================================================
@@ -98,6 +112,13 @@ class TestTLEData:
         assert "1 00000U" in tle_str
         assert "2 00000" in tle_str
 
+    def test_tle_data_is_immutable(self):
+        """Test that TLEData fields cannot be reassigned"""
+        tle = TLEData(name="ISS", line1="1 25544U", line2="2 25544")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tle.name = "OTHER"
+        assert not hasattr(tle, "__dict__")
+
 
 # =============================================================================
 # Test TLEManager Initialization
@@ -113,7 +134,6 @@ class TestTLEManagerInitialization:
         assert manager.cache_dir == temp_cache_dir
         assert manager.cache_expiry_hours == 12
         assert manager.cache_file == temp_cache_dir / "satellites.tle"
-        assert manager.metadata_file == temp_cache_dir / "metadata.json"
 
     def test_initialization_creates_cache_dir(self, tmp_path):
         """Test that cache directory is created if it doesn't exist"""
@@ -129,7 +149,6 @@ class TestTLEManagerInitialization:
         manager = TLEManager()
         assert manager.cache_dir == Path.home() / ".cache" / "orbitstream" / "tle"
         assert manager.cache_file.name == "satellites.tle"
-        assert manager.metadata_file.name == "metadata.json"
 
     def test_initial_cache_is_empty(self, tle_manager):
         """Test that cache starts empty"""
@@ -144,14 +163,11 @@ class TestTLEManagerInitialization:
 class TestTLEDataLoading:
     """Tests for loading TLE data"""
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_load_tle_data_from_network(self, mock_get, tle_manager, mock_celestrak_response):
         """Test downloading TLE data from Celestrak"""
         # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.text = mock_celestrak_response
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = celestrak_response(mock_celestrak_response)
 
         # Load TLE data
         tle_data = tle_manager.load_tle_data()
@@ -167,7 +183,7 @@ class TestTLEDataLoading:
         assert iss_tle.line1.startswith("1 25544")
         assert iss_tle.line2.startswith("2 25544")
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_load_tle_data_force_refresh(self, mock_get, tle_manager, mock_celestrak_response):
         """Test force_refresh parameter bypasses cache"""
         # Create existing cache
@@ -175,10 +191,7 @@ class TestTLEDataLoading:
         tle_manager._save_to_cache()
 
         # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.text = mock_celestrak_response
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = celestrak_response(mock_celestrak_response)
 
         # Force refresh should download new data
         tle_data = tle_manager.load_tle_data(force_refresh=True)
@@ -210,16 +223,14 @@ class TestTLEDataLoading:
         tle_manager._tle_cache = sample_tle_data
         tle_manager._save_to_cache()
 
-        # Modify metadata to make cache appear old
-        old_time = datetime.now(timezone.utc) - timedelta(hours=25)
-        with open(tle_manager.metadata_file, 'w') as f:
-            json.dump({'cached_at': old_time.isoformat()}, f)
+        # Rewrite the header to make cache appear old
+        age_cache(tle_manager, hours=25)
 
         # Clear in-memory cache
         tle_manager._tle_cache = {}
 
         # With mock for network (using fallback if network fails)
-        with patch('generators.tle_manager.requests.get') as mock_get:
+        with patch('generators.tle_manager.requests.Session.get') as mock_get:
             mock_get.side_effect = requests.RequestException("Network error")
             tle_data = tle_manager.load_tle_data()
 
@@ -235,38 +246,60 @@ class TestTLEDataLoading:
 class TestGetSatelliteTLE:
     """Tests for get_satellite_tle method"""
 
-    def test_get_satellite_tle_exact_match(self, tle_manager, sample_tle_data):
+    def test_get_satellite_tle_exact_match(self, loaded_tle_manager):
         """Test getting TLE with exact name match"""
-        tle_manager._tle_cache = sample_tle_data
-
-        tle = tle_manager.get_satellite_tle("ISS")
+        tle = loaded_tle_manager.get_satellite_tle("ISS")
         assert tle is not None
         assert tle.name == "ISS"
 
-    def test_get_satellite_tle_case_insensitive(self, tle_manager, sample_tle_data):
+    def test_get_satellite_tle_case_insensitive(self, loaded_tle_manager):
         """Test case-insensitive satellite name matching"""
-        tle_manager._tle_cache = sample_tle_data
-
         # Test various case combinations
         for name in ["iss", "Iss", "ISS", "iSs"]:
-            tle = tle_manager.get_satellite_tle(name)
+            tle = loaded_tle_manager.get_satellite_tle(name)
             assert tle is not None
             assert tle.name == "ISS"
 
-    def test_get_satellite_tle_partial_match(self, tle_manager, sample_tle_data):
+    def test_get_satellite_tle_partial_match(self, loaded_tle_manager):
         """Test partial name matching"""
-        tle_manager._tle_cache = sample_tle_data
-
-        tle = tle_manager.get_satellite_tle("STARLINK")
+        tle = loaded_tle_manager.get_satellite_tle("STARLINK")
         assert tle is not None
         assert "STARLINK" in tle.name.upper()
 
-    def test_get_satellite_tle_not_found(self, tle_manager, sample_tle_data):
+    def test_get_satellite_tle_not_found(self, loaded_tle_manager):
         """Test getting TLE for non-existent satellite"""
+        tle = loaded_tle_manager.get_satellite_tle("NONEXISTENT")
+        assert tle is None
+
+    def test_get_satellite_tle_after_cache_replaced(self, tle_manager, sample_tle_data):
+        """Test that lookups see a replaced cache rather than a stale index"""
+        tle_manager._tle_cache = {"ISS": sample_tle_data["ISS"]}
+        assert tle_manager.get_satellite_tle("NOAA-18") is None
+
         tle_manager._tle_cache = sample_tle_data
+        assert tle_manager.get_satellite_tle("NOAA-18") is not None
 
-        tle = tle_manager.get_satellite_tle("NONEXISTENT")
-        assert tle is None
+    def test_get_satellite_tle_partial_scan_runs_once(self, tle_manager, sample_tle_data):
+        """Test that repeated partial lookups and misses reuse the first scan"""
+        tle_manager._tle_cache = sample_tle_data
+
+        with patch.object(TLEManager, "_partial_lookup", wraps=TLEManager._partial_lookup) as scan:
+            for _ in range(3):
+                assert tle_manager.get_satellite_tle("starlink") is not None
+                assert tle_manager.get_satellite_tle("NONEXISTENT") is None
+        assert scan.call_count == 2
+
+        # A new cache is scanned afresh
+        tle_manager._tle_cache = {"ISS": sample_tle_data["ISS"]}
+        assert tle_manager.get_satellite_tle("STARLINK") is None
+
+    def test_partial_match_memo_is_bounded(self, tle_manager, sample_tle_data, monkeypatch):
+        """Test that looking up many unknown names does not grow the memo without limit"""
+        monkeypatch.setattr(tle_manager_module, "PARTIAL_MATCH_MEMO_SIZE", 4)
+        tle_manager._tle_cache = sample_tle_data
+        for i in range(10):
+            assert tle_manager.get_satellite_tle(f"UNKNOWN-{i}") is None
+            assert len(tle_manager._partial_matches) <= 4
 
 
 # =============================================================================
@@ -277,25 +310,21 @@ class TestGetSatelliteTLE:
 class TestAvailableSatellites:
     """Tests for available satellites list"""
 
-    def test_get_available_satellites(self, tle_manager, sample_tle_data):
+    def test_get_available_satellites(self, loaded_tle_manager, sample_tle_data):
         """Test getting list of available satellites"""
-        tle_manager._tle_cache = sample_tle_data
-
-        satellites = tle_manager.get_available_satellites()
+        satellites = loaded_tle_manager.get_available_satellites()
         assert len(satellites) == len(sample_tle_data)
         assert "ISS" in satellites
         assert "NOAA-18" in satellites
 
-    def test_get_real_satellite_names(self, tle_manager, sample_tle_data):
+    def test_get_real_satellite_names(self, loaded_tle_manager):
         """Test getting real satellite names"""
-        tle_manager._tle_cache = sample_tle_data
-
-        satellites = tle_manager.get_real_satellite_names(count=3)
+        satellites = loaded_tle_manager.get_real_satellite_names(count=3)
         assert len(satellites) <= 3
 
         # All returned satellites should be in our cache
         for name in satellites:
-            assert tle_manager.get_satellite_tle(name) is not None
+            assert loaded_tle_manager.get_satellite_tle(name) is not None
 
     def test_get_real_satellite_names_more_than_available(self, temp_cache_dir):
         """Test requesting more satellites than available"""
@@ -315,6 +344,21 @@ class TestAvailableSatellites:
         assert len(satellites) == 10
         assert all(name == "ISS" for name in satellites)
 
+    def test_get_real_satellite_names_cycles_all_available(self, loaded_tle_manager):
+        """Test that filling up to count cycles through every available satellite"""
+        satellites = loaded_tle_manager.get_real_satellite_names(count=len(REAL_SATELLITES) + 4)
+        assert len(satellites) == len(REAL_SATELLITES) + 4
+        available = [name for name in REAL_SATELLITES if loaded_tle_manager.get_satellite_tle(name)]
+        assert satellites[len(available):2 * len(available)] == available
+
+    def test_get_real_satellite_names_tops_up_from_cache(self, tle_manager, sample_tle_data):
+        """Test that cached satellites outside REAL_SATELLITES fill the shortfall"""
+        extra = TLEData("OBSCURESAT-7", "1 line", "2 line")
+        tle_manager._tle_cache = {**sample_tle_data, extra.name: extra}
+
+        satellites = tle_manager.get_real_satellite_names(count=len(sample_tle_data) + 1)
+        assert sorted(satellites) == sorted([*sample_tle_data, extra.name])
+
 
 # =============================================================================
 # Test Cache Management
@@ -332,16 +376,53 @@ class TestCacheManagement:
         # Verify cache file exists
         assert tle_manager.cache_file.exists()
 
-        # Verify metadata file exists
-        assert tle_manager.metadata_file.exists()
+        # Verify header content
+        data = tle_manager.cache_file.read_bytes()
+        magic, _, _, cached_at, count, crc, _, _ = CACHE_HEADER.unpack_from(data)
+
+        assert magic == CACHE_MAGIC
+        assert cached_at > 0
+        assert count == len(sample_tle_data)
+        assert crc == zlib.crc32(data[CACHE_HEADER.size:])
+
+    def test_uncompressed_cache_round_trip(self, tle_manager, sample_tle_data, monkeypatch):
+        """Test that without zstandard the cache stores and reloads plain TLE text"""
+        monkeypatch.setattr(tle_manager_module, "zstandard", None)
+        tle_manager._tle_cache = sample_tle_data
+        tle_manager._save_to_cache()
+
+        data = tle_manager.cache_file.read_bytes()
+        assert CACHE_HEADER.unpack_from(data)[2] == CODEC_RAW
+        assert data[CACHE_HEADER.size:].startswith(b"ISS")
+
+        tle_manager._tle_cache = {}
+        tle_manager._load_from_cache()
+        assert tle_manager._tle_cache == sample_tle_data
+
+    def test_zstd_cache_invalid_without_zstandard(self, tle_manager, sample_tle_data, monkeypatch):
+        """Test that a compressed cache is treated as missing when zstandard is unavailable"""
+        tle_manager._tle_cache = sample_tle_data
+        tle_manager._save_to_cache()
+        fields = list(CACHE_HEADER.unpack_from(tle_manager.cache_file.read_bytes()))
+        fields[2] = CODEC_ZSTD
+        with open(tle_manager.cache_file, 'r+b') as f:
+            f.write(CACHE_HEADER.pack(*fields))
 
-        # Verify metadata content
-        with open(tle_manager.metadata_file, 'r') as f:
-            metadata = json.load(f)
+        monkeypatch.setattr(tle_manager_module, "zstandard", None)
+        assert tle_manager._is_cache_valid() is False
+        tle_manager._load_from_cache()
+        assert tle_manager._tle_cache == {}
 
-        assert 'cached_at' in metadata
-        assert 'satellite_count' in metadata
-        assert metadata['satellite_count'] == len(sample_tle_data)
+    def test_save_to_cache_replaces_file_atomically(self, tle_manager, sample_tle_data):
+        """Test that the cache is written to a temporary file and renamed into place"""
+        tle_manager._tle_cache = {"OLD": TLEData("OLD", "1 line", "2 line")}
+        tle_manager._save_to_cache()
+        tle_manager._tle_cache = sample_tle_data
+        tle_manager._save_to_cache()
+
+        assert [path.name for path in tle_manager.cache_dir.iterdir()] == ["satellites.tle"]
+        tle_manager._load_from_cache()
+        assert tle_manager._tle_cache == sample_tle_data
 
     def test_load_from_cache(self, tle_manager, sample_tle_data):
         """Test loading TLE data from cache file"""
@@ -360,6 +441,17 @@ class TestCacheManagement:
         assert "ISS" in tle_manager._tle_cache
         assert tle_manager._tle_cache["ISS"].name == "ISS"
 
+    def test_load_from_cache_round_trips_every_record(self, tle_manager, sample_tle_data):
+        """Test that every saved record is loaded back unchanged"""
+        tle_manager._tle_cache = sample_tle_data
+        tle_manager._save_to_cache()
+
+        tle_manager._tle_cache = {}
+        tle_manager._load_from_cache()
+
+        assert tle_manager._tle_cache == sample_tle_data
+        assert list(tle_manager._tle_cache) == list(sample_tle_data)
+
     def test_is_cache_valid_with_valid_cache(self, tle_manager):
         """Test cache validity check with valid cache"""
         # Create valid cache
@@ -373,10 +465,8 @@ class TestCacheManagement:
         # Create cache
         tle_manager._save_to_cache()
 
-        # Modify metadata to make cache appear old
-        old_time = datetime.now(timezone.utc) - timedelta(hours=25)
-        with open(tle_manager.metadata_file, 'w') as f:
-            json.dump({'cached_at': old_time.isoformat()}, f)
+        # Rewrite the header to make cache appear old
+        age_cache(tle_manager, hours=25)
 
         # Cache should be invalid
         assert tle_manager._is_cache_valid() is False
@@ -385,13 +475,27 @@ class TestCacheManagement:
         """Test cache validity check without cache file"""
         assert tle_manager._is_cache_valid() is False
 
-    def test_is_cache_valid_without_metadata_file(self, tle_manager):
-        """Test cache validity check without metadata file"""
-        # Create cache file but not metadata
+    def test_is_cache_valid_without_header(self, tle_manager, mock_celestrak_response):
+        """Test cache validity check on a file without a cache header"""
+        # Empty file, then plain TLE text as written by older versions
         tle_manager.cache_file.touch()
+        assert tle_manager._is_cache_valid() is False
 
+        tle_manager.cache_file.write_text(mock_celestrak_response)
         assert tle_manager._is_cache_valid() is False
 
+    def test_load_from_cache_rejects_corrupt_body(self, tle_manager, sample_tle_data):
+        """Test that a cache whose TLE text fails the CRC check is not loaded"""
+        tle_manager._tle_cache = sample_tle_data
+        tle_manager._save_to_cache()
+        with open(tle_manager.cache_file, 'r+b') as f:
+            f.seek(CACHE_HEADER.size)
+            f.write(b"X")
+
+        tle_manager._tle_cache = {}
+        tle_manager._load_from_cache()
+        assert tle_manager._tle_cache == {}
+
 
 # =============================================================================
 # Test Fallback Behavior
@@ -401,7 +505,7 @@ class TestCacheManagement:
 class TestFallbackBehavior:
     """Tests for fallback TLE data when network fails"""
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_fallback_tle_on_network_failure(self, mock_get, tle_manager):
         """Test that fallback TLE is used when network fails"""
         # Mock network failure
@@ -413,7 +517,7 @@ class TestFallbackBehavior:
         # Should have at least ISS from fallback
         assert "ISS" in tle_data
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_fallback_tle_structure(self, mock_get, tle_manager):
         """Test that fallback TLE has correct structure"""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -435,13 +539,10 @@ class TestFallbackBehavior:
 class TestNetworkDownload:
     """Tests for TLE data download from network"""
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_download_tle_data_success(self, mock_get, tle_manager, mock_celestrak_response):
         """Test successful TLE data download"""
-        mock_response = Mock()
-        mock_response.text = mock_celestrak_response
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = celestrak_response(mock_celestrak_response)
 
         tle_manager._download_tle_data()
 
@@ -450,7 +551,105 @@ class TestNetworkDownload:
         assert "ISS" in tle_manager._tle_cache
         assert "NOAA-18" in tle_manager._tle_cache
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
+    def test_download_tle_data_skips_malformed_records(self, mock_get, tle_manager,
+                                                       mock_celestrak_response):
+        """Test that comments, CRLF endings and incomplete records are handled"""
+        text = (
+            "# active satellites\n"
+            "BROKEN\n"
+            "1 99999U 00000A   24010.50000000  .00000000  00000-0  00000-0 0  9990\n"
+            + mock_celestrak_response
+        ).replace("\n", "\r\n")
+        mock_get.return_value = celestrak_response(text)
+
+        tle_manager._download_tle_data()
+
+        assert list(tle_manager._tle_cache) == ["ISS", "NOAA-18"]
+        iss = tle_manager._tle_cache["ISS"]
+        assert iss.line1.startswith("1 25544") and not iss.line1.endswith("\r")
+        assert iss.line2.startswith("2 25544") and not iss.line2.endswith("\r")
+
+    @patch('generators.tle_manager.requests.Session.get')
+    def test_download_tle_data_trims_whitespace(self, mock_get, tle_manager,
+                                                mock_celestrak_response):
+        """Test that padding around names and element lines is not captured"""
+        iss_line1, iss_line2 = mock_celestrak_response.splitlines()[1:3]
+        mock_get.return_value = celestrak_response(f"  ISS (ZARYA) \t\n {iss_line1}  \n\t{iss_line2} \n")
+
+        tle_manager._download_tle_data()
+
+        assert tle_manager._tle_cache == {
+            "ISS (ZARYA)": TLEData("ISS (ZARYA)", iss_line1, iss_line2)
+        }
+
+    @patch('generators.tle_manager.requests.Session.get')
+    def test_download_without_cache_is_unconditional(self, mock_get, tle_manager,
+                                                     mock_celestrak_response):
+        """Test that no validators are sent when there is no cache file"""
+        mock_get.return_value = celestrak_response(mock_celestrak_response)
+
+        assert tle_manager._download_tle_data() is True
+        assert mock_get.call_args.kwargs["headers"] == {}
+
+    @patch('generators.tle_manager.requests.Session.get')
+    def test_download_not_modified_reuses_cache(self, mock_get, tle_manager,
+                                                mock_celestrak_response):
+        """Test that a 304 answer reloads the cache and only refreshes its timestamp"""
+        validators = {"ETag": '"abc123"', "Last-Modified": "Wed, 10 Jan 2024 12:00:00 GMT"}
+        mock_get.return_value = celestrak_response(mock_celestrak_response, headers=validators)
+        tle_manager.load_tle_data()
+        body = tle_manager.cache_file.read_bytes()[CACHE_HEADER.size:]
+
+        age_cache(tle_manager, hours=25)
+        tle_manager._tle_cache = {}
+        mock_get.return_value = celestrak_response(status_code=304)
+        tle_data = tle_manager.load_tle_data()
+
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"abc123"',
+            "If-Modified-Since": "Wed, 10 Jan 2024 12:00:00 GMT",
+        }
+        assert list(tle_data) == ["ISS", "NOAA-18"]
+        assert tle_manager._is_cache_valid() is True
+        assert tle_manager.cache_file.read_bytes()[CACHE_HEADER.size:] == body
+
+    @patch('generators.tle_manager.requests.Session.get')
+    def test_fallback_data_is_cached_without_validators(self, mock_get, tle_manager):
+        """Test that fallback TLEs never carry the validators of a real download"""
+        mock_get.side_effect = requests.RequestException("Network error")
+        tle_manager._validators = {"ETag": '"abc123"'}
+
+        tle_manager.load_tle_data()
+
+        assert tle_manager._read_cache_header()[3:] == ("", "")
+
+    @patch('generators.tle_manager.requests.Session.get', autospec=True)
+    def test_download_retries_transient_failures(self, mock_get, tle_manager,
+                                                 mock_celestrak_response):
+        """Test that the download goes through a session that retries with backoff"""
+        mock_get.return_value = celestrak_response(mock_celestrak_response)
+
+        tle_manager._download_tle_data()
+
+        session = mock_get.call_args.args[0]
+        assert session.get_adapter("https://celestrak.org").max_retries is DOWNLOAD_RETRY
+        assert DOWNLOAD_RETRY.total == 3
+        assert 503 in DOWNLOAD_RETRY.status_forcelist
+
+    @patch('generators.tle_manager.requests.Session.get')
+    def test_download_bounds_time_spent_on_a_hung_server(self, mock_get, tle_manager,
+                                                         mock_celestrak_response):
+        """Test that read timeouts are retried once, with a short per-attempt timeout"""
+        mock_get.return_value = celestrak_response(mock_celestrak_response)
+
+        tle_manager._download_tle_data()
+
+        assert DOWNLOAD_RETRY.read == 1
+        assert mock_get.call_args.kwargs["timeout"] == DOWNLOAD_TIMEOUT
+        assert (DOWNLOAD_RETRY.read + 1) * DOWNLOAD_TIMEOUT[1] <= 30
+
+    @patch('generators.tle_manager.requests.Session.get')
     def test_download_tle_data_request_exception(self, mock_get, tle_manager):
         """Test handling of network request exception"""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -461,7 +660,7 @@ class TestNetworkDownload:
         # Should have fallback data
         assert len(tle_manager._tle_cache) >= 1
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_download_tle_data_http_error(self, mock_get, tle_manager):
         """Test handling of HTTP error"""
         mock_get.side_effect = requests.HTTPError("404 Not Found")
@@ -472,7 +671,7 @@ class TestNetworkDownload:
         # Should have fallback data
         assert len(tle_manager._tle_cache) >= 1
 
-    @patch('generators.tle_manager.requests.get')
+    @patch('generators.tle_manager.requests.Session.get')
     def test_download_tle_data_timeout(self, mock_get, tle_manager):
         """Test handling of network timeout"""
         mock_get.side_effect = requests.Timeout("Connection timeout")